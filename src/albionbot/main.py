@@ -16,29 +16,41 @@ from .utils.permissions import (
     PERM_BANK_MANAGER,
     PERM_RAID_MANAGER,
     PERM_TICKET_MANAGER,
-    can_manage_bank,
-    can_manage_raids,
-    can_manage_tickets,
     is_guild_admin,
+    manager_permissions,
 )
 
 log = logging.getLogger("albionbot")
 
 
-def build_bot() -> commands.Bot:
+class AlbionBot(commands.Bot):
+    def __init__(self, store: Store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    async def close(self) -> None:
+        # Drain saves queued by request_save() while the loop still runs.
+        try:
+            await self.store.flush()
+        finally:
+            await super().close()
+
+
+def build_bot(store: Store) -> commands.Bot:
     intents = nextcord.Intents.default()
     intents.guilds = True
     intents.members = True
     intents.voice_states = True
     # If DM wizard doesn't capture messages, enable Message Content Intent in the portal and uncomment:
     # intents.message_content = True
-    return commands.Bot(intents=intents)
+    return AlbionBot(store, intents=intents)
 
 
 def _build_help_lines(member: nextcord.Member, cfg, store: Store) -> List[str]:
-    is_raid_manager = can_manage_raids(cfg, member, store)
-    is_bank_manager = can_manage_bank(cfg, member, store)
-    is_ticket_manager = can_manage_tickets(cfg, member, store)
+    held = manager_permissions(cfg, member, store)
+    is_raid_manager = PERM_RAID_MANAGER in held
+    is_bank_manager = PERM_BANK_MANAGER in held
+    is_ticket_manager = PERM_TICKET_MANAGER in held
 
     lines: List[str] = [
         "**Commandes joueur**",
@@ -117,7 +129,7 @@ def main():
         bank_database_url=cfg.bank_database_url,
         bank_sqlite_path=cfg.bank_sqlite_path,
     )
-    bot = build_bot()
+    bot = build_bot(store)
 
     raids = RaidModule(bot, store, cfg)
     bank = BankModule(bot, store, cfg)
@@ -176,7 +188,7 @@ def main():
 
         async with store.lock:
             store.set_permission_role_ids(interaction.guild.id, permission, valid_role_ids)
-            store.save()
+            await store.save_async()
 
         if valid_role_ids:
             role_mentions = " ".join(f"<@&{rid}>" for rid in valid_role_ids)
@@ -232,7 +244,7 @@ def main():
 
                 async with store.lock:
                     store.set_permission_role_ids(modal_interaction.guild.id, permission, valid_role_ids)
-                    store.save()
+                    await store.save_async()
 
                 if valid_role_ids:
                     role_mentions = " ".join(f"<@&{rid}>" for rid in valid_role_ids)
@@ -254,7 +266,7 @@ def main():
             return
         async with store.lock:
             tickets.append_message_snapshot(message)
-            store.save()
+            store.request_save()
 
     @bot.event
     async def on_message_edit(before: nextcord.Message, after: nextcord.Message):
@@ -262,7 +274,7 @@ def main():
             return
         async with store.lock:
             tickets.append_edit_snapshot(before, after)
-            store.save()
+            store.request_save()
 
     @bot.event
     async def on_message_delete(message: nextcord.Message):
@@ -270,21 +282,25 @@ def main():
             return
         async with store.lock:
             tickets.append_delete_snapshot(message)
-            store.save()
+            store.request_save()
 
     @bot.event
     async def on_guild_channel_delete(channel: nextcord.abc.GuildChannel):
         async with store.lock:
             ticket = tickets.finalize_ticket(channel.id, status="deleted")
             if ticket:
-                store.save()
+                store.request_save()
 
     @bot.event
     async def on_thread_delete(thread: nextcord.Thread):
         async with store.lock:
             ticket = tickets.finalize_ticket(thread.id, status="deleted")
             if ticket:
-                store.save()
+                store.request_save()
+
+    @bot.event
+    async def on_guild_remove(guild: nextcord.Guild):
+        store.drop_guild_lock(guild.id)
 
     @bot.event
     async def on_guild_channel_update(before: nextcord.abc.GuildChannel, after: nextcord.abc.GuildChannel):
@@ -294,7 +310,7 @@ def main():
             async with store.lock:
                 ticket = tickets.finalize_ticket(after.id, status="closed")
                 if ticket:
-                    store.save()
+                    store.request_save()
 
     @bot.event
     async def on_ready():
@@ -341,3 +357,5 @@ def main():
         status_index = (status_index + 1) % len(rotating_statuses)
 
     bot.run(cfg.discord_token)
+    # Safety net when the loop stopped before close() could flush (e.g. SIGTERM).
+    store.save()
@@ -65,16 +65,16 @@ def compute_split_deltas(total: int, user_ids: List[int], sign: int) -> Dict[int
 def can_apply_deltas(store: Store, guild_id: int, deltas: Dict[int, int], allow_negative: bool) -> Tuple[bool, str]:
     if allow_negative:
         return True, ""
+    balances = store.bank_get_balances(guild_id, list(deltas))
     for uid, delta in deltas.items():
-        cur = store.bank_get_balance(guild_id, uid)
+        cur = balances[uid]
         if cur + delta < 0:
             return False, f"Solde insuffisant pour {mention(uid)} (bal={cur}, delta={delta})."
     return True, ""
 
 def apply_deltas(store: Store, guild_id: int, deltas: Dict[int, int]) -> None:
-    for uid, delta in deltas.items():
-        cur = store.bank_get_balance(guild_id, uid)
-        store.bank_set_balance(guild_id, uid, cur + delta)
+    balances = store.bank_get_balances(guild_id, list(deltas))
+    store.bank_set_balances(guild_id, {uid: balances[uid] + delta for uid, delta in deltas.items()})
 
 def find_last_action_for_actor(store: Store, guild_id: int, actor_id: int) -> Optional[BankAction]:
     return store.bank_find_last_action_for_actor(guild_id, actor_id)
@@ -96,6 +96,7 @@ class BankModule:
         targets: str,
         note: str,
         split: bool,
+        resolved: Optional[List[nextcord.Member]] = None,
     ) -> Tuple[bool, str]:
         if amount < 0:
             return False, "Montant invalide (>=0)."
@@ -103,7 +104,8 @@ class BankModule:
         if not interaction.guild:
             return False, "Commande serveur uniquement."
 
-        resolved = resolve_targets(interaction.guild, user=user, role=role, targets_text=targets or "")
+        if resolved is None:
+            resolved = resolve_targets(interaction.guild, user=user, role=role, targets_text=targets or "")
         if not resolved:
             return False, "Aucune cible trouvée. Utilise `user`, `role` ou `targets`."
 
@@ -118,7 +120,7 @@ class BankModule:
             sign = +1 if action_type == "add" else -1
             deltas = {uid: sign * amount for uid in ids}
 
-        async with self.store.lock:
+        async with self.store.bank_lock(guild_id):
             ok, reason = can_apply_deltas(self.store, guild_id, deltas, allow_negative=self.cfg.bank_allow_negative)
             if not ok:
                 return False, reason
@@ -135,7 +137,7 @@ class BankModule:
                 note=note.strip() if note else "",
             )
             self.store.bank_append_action(action)
-            self.store.save()
+            await self.store.bank_save_async()
 
         total_delta = sum(deltas.values())
         n = len(deltas)
@@ -180,11 +182,14 @@ class BankModule:
         )
 
         async def _confirm(confirm_interaction: nextcord.Interaction):
-            ok, message = await self._apply_bank_action(confirm_interaction, action_type, amount, user, role, targets, note, split)
+            # Apply to the targets shown in the summary instead of resolving them again.
+            ok, message = await self._apply_bank_action(
+                confirm_interaction, action_type, amount, user, role, targets, note, split, resolved=resolved,
+            )
             if ok:
-                await confirm_interaction.response.edit_message(content=message, view=None)
+                await confirm_interaction.edit_original_message(content=message, view=None)
             else:
-                await confirm_interaction.response.send_message(f"⛔ {message}", ephemeral=True)
+                await confirm_interaction.followup.send(f"⛔ {message}", ephemeral=True)
 
         view = BankActionConfirmView(owner_id=interaction.user.id, on_confirm=_confirm)
         await interaction.response.send_message(summary, ephemeral=True, view=view)
@@ -208,7 +213,7 @@ class BankModule:
         to_uid = to_user.id
         amt = int(amount)
 
-        async with self.store.lock:
+        async with self.store.bank_lock(guild_id):
             from_bal = self.store.bank_get_balance(guild_id, from_uid)
             if from_bal < amt:
                 return False, f"Solde insuffisant: {from_bal:,}"
@@ -216,7 +221,7 @@ class BankModule:
             self.store.bank_set_balance(guild_id, from_uid, from_bal - amt)
             to_bal = self.store.bank_get_balance(guild_id, to_uid)
             self.store.bank_set_balance(guild_id, to_uid, to_bal + amt)
-            self.store.save()
+            await self.store.bank_save_async()
 
         return True, f"💸 {interaction.user.mention} a payé {to_user.mention} : **{amt:,}**" + (f"\n📝 {note.strip()}" if note.strip() else "")
 
@@ -327,9 +332,11 @@ class BankModule:
             async def _submit_payment(modal_interaction: nextcord.Interaction, amount: int, note: str):
                 ok, message = await self._apply_payment(modal_interaction, to_user, amount, note)
                 if ok:
-                    await modal_interaction.response.send_message(message, ephemeral=False)
+                    await modal_interaction.edit_original_message(content=message)
                 else:
-                    await modal_interaction.response.send_message(f"⛔ {message}", ephemeral=True)
+                    # The deferred reply is public: swap it for a private error.
+                    await modal_interaction.delete_original_message()
+                    await modal_interaction.followup.send(f"⛔ {message}", ephemeral=True)
 
             await interaction.response.send_modal(PayDetailsModal(on_submit=_submit_payment))
 
@@ -361,7 +368,7 @@ class BankModule:
             guild_id = interaction.guild.id
             actor_id = interaction.user.id
 
-            async with self.store.lock:
+            async with self.store.bank_lock(guild_id):
                 action = find_last_action_for_actor(self.store, guild_id, actor_id)
                 if not action:
                     return await interaction.response.send_message("Aucune action annulable trouvée.", ephemeral=True)
@@ -379,6 +386,6 @@ class BankModule:
                 action.undone = True
                 action.undone_at = _now()
                 self.store.bank_mark_action_undone(action.action_id, action.undone_at)
-                self.store.save()
+                await self.store.bank_save_async()
 
             await interaction.response.send_message(f"↩️ Undo OK : action `{action.action_type}` (`{action.action_id}`) annulée.", ephemeral=True)
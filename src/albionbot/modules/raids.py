@@ -354,7 +354,6 @@ class RaidModule:
     def build_view(self, raid: RaidEvent, tpl: CompTemplate) -> RaidView:
         join_disabled = raid.ping_done or (_now() >= raid.start_at) or raid.cleanup_done
         return RaidView(
-            bot=self.bot,
             raid=raid,
             template=tpl,
             join_disabled=join_disabled,
@@ -430,7 +429,7 @@ class RaidModule:
                 persisted.channel_id = msg.channel.id
                 persisted.message_id = msg.id
                 persisted.thread_id = thread.id if thread else None
-                self.store.save()
+                await self.store.save_async()
 
             try:
                 self.bot.add_view(view, message_id=msg.id)
@@ -463,7 +462,7 @@ class RaidModule:
                 reason=f"Temp raid role {raid.raid_id}",
             )
             raid.temp_role_id = role.id
-            self.store.save()
+            await self.store.save_async()
             return role
         except Exception:
             log.exception("Failed to create temp role")
@@ -600,7 +599,7 @@ class RaidModule:
             present_unexpected = []
             missing_expected = []
 
-        raid.last_voice_present_ids = list(present_expected)
+        raid.last_voice_present_ids = present_expected
 
         def fmt(ids: List[int]) -> str:
             if not ids:
@@ -668,7 +667,7 @@ class RaidModule:
         role = guild.get_role(raid.temp_role_id)
         if not role:
             raid.temp_role_id = None
-            self.store.save()
+            await self.store.save_async()
             return
         for uid in list(raid.signups.keys()):
             m = guild.get_member(uid)
@@ -687,7 +686,7 @@ class RaidModule:
         except Exception:
             pass
         raid.temp_role_id = None
-        self.store.save()
+        await self.store.save_async()
 
     # ---------- UI callbacks
     async def _on_select(self, interaction: nextcord.Interaction, raid_id: str, role_key: str):
@@ -728,10 +727,10 @@ class RaidModule:
             if cur_signup and cur_signup.role_key == "raid_leader" and role_key != "raid_leader":
                 return await interaction.response.send_message("⛔ Le Raid Leader ne peut pas s'inscrire sur un autre rôle.", ephemeral=True)
             raid.absent.discard(member.id)
-            self.store.save()
+            self.store.request_save()
 
         if role_def.ip_required:
-            modal = IpModal(bot=self.bot, raid_id=raid_id, role_key=role_key, role_label=role_def.label, on_submit=self._ip_modal_submit)
+            modal = IpModal(raid_id=raid_id, role_key=role_key, role_label=role_def.label, on_submit=self._ip_modal_submit)
             return await interaction.response.send_modal(modal)
 
         await self._finalize_join(interaction, raid_id, role_key, ip=None)
@@ -781,7 +780,7 @@ class RaidModule:
             if raid.prep_done and not raid.ping_done:
                 late_assign = True
 
-            self.store.save()
+            self.store.request_save()
 
         if late_assign:
             raid = self.store.raids.get(raid_id)
@@ -803,11 +802,11 @@ class RaidModule:
                 return await interaction.response.send_message("⛔ Notifications closes après mass-up.", ephemeral=True)
             if uid in raid.dm_notify_users:
                 raid.dm_notify_users.discard(uid)
-                self.store.save()
+                self.store.request_save()
                 msg = "🔕 Notifications DM désactivées pour ce raid."
             else:
                 raid.dm_notify_users.add(uid)
-                self.store.save()
+                self.store.request_save()
                 msg = "🔔 Notifications DM activées pour ce raid."
         await interaction.response.send_message(msg, ephemeral=True)
 
@@ -832,14 +831,14 @@ class RaidModule:
 
             if uid in raid.absent:
                 raid.absent.discard(uid)
-                self.store.save()
+                self.store.request_save()
                 await interaction.response.send_message("✅ Absent retiré.", ephemeral=True)
             else:
                 raid.absent.add(uid)
                 if uid in raid.signups:
                     del raid.signups[uid]
                 recompute_promotions(raid, tpl)
-                self.store.save()
+                self.store.request_save()
                 await interaction.response.send_message("🚫 Marqué absent (retiré roster/waitlist).", ephemeral=True)
 
         await self.refresh_raid_message(raid_id)
@@ -873,7 +872,7 @@ class RaidModule:
 
             if changed:
                 recompute_promotions(raid, tpl)
-                self.store.save()
+                self.store.request_save()
 
         if not changed:
             return await interaction.response.send_message("Tu n'es ni inscrit ni absent.", ephemeral=True)
@@ -1019,7 +1018,7 @@ class RaidModule:
                 raid_required_role_ids=raid_req_ids,
                 roles=roles,
             )
-            self.store.save()
+            await self.store.save_async()
 
         wtxt = ""
         if warnings:
@@ -1052,7 +1051,7 @@ class RaidModule:
                     persisted.updated_at = _now()
                     persisted.attempts += 1
                     persisted.next_attempt_at = persisted.updated_at + self._compute_command_retry_delay(persisted.attempts)
-                    self.store.save()
+                    await self.store.save_async()
                 continue
 
             if raid.message_id:
@@ -1064,7 +1063,7 @@ class RaidModule:
                     persisted.last_error = ""
                     persisted.updated_at = _now()
                     persisted.delivered_at = persisted.updated_at
-                    self.store.save()
+                    await self.store.save_async()
                 continue
 
             success, error = await self.publish_raid_if_needed(raid.raid_id)
@@ -1082,7 +1081,7 @@ class RaidModule:
                     persisted.status = "failed"
                     persisted.last_error = (error or "Erreur Discord inconnue")[:500]
                     persisted.next_attempt_at = persisted.updated_at + self._compute_command_retry_delay(persisted.attempts)
-                self.store.save()
+                await self.store.save_async()
 
     # ---------- Scheduler
     @tasks.loop(seconds=15)
@@ -1103,7 +1102,7 @@ class RaidModule:
                         except Exception:
                             log.exception("Prep failed")
                         r.prep_done = True
-                        self.store.save()
+                        await self.store.save_async()
                 await self.refresh_raid_message(raid.raid_id)
 
             if not raid.ping_done and now >= raid.start_at:
@@ -1115,7 +1114,7 @@ class RaidModule:
                         except Exception:
                             log.exception("Ping failed")
                         r.ping_done = True
-                        self.store.save()
+                        await self.store.save_async()
                 await self.refresh_raid_message(raid.raid_id)
 
             check_at = raid.start_at + self.cfg.voice_check_after_minutes * 60
@@ -1128,7 +1127,7 @@ class RaidModule:
                         except Exception:
                             log.exception("Voice report failed")
                         r.voice_check_done = True
-                        self.store.save()
+                        await self.store.save_async()
 
             cleanup_at = raid.start_at + raid.cleanup_minutes * 60
             if not raid.cleanup_done and now >= cleanup_at:
@@ -1140,7 +1139,7 @@ class RaidModule:
                         except Exception:
                             log.exception("Cleanup failed")
                         r.cleanup_done = True
-                        self.store.save()
+                        await self.store.save_async()
                 await self.refresh_raid_message(raid.raid_id)
 
     async def _edit_raid_data(self, raid_id: str, *, title: str = "", start: str = "") -> Tuple[bool, str]:
@@ -1165,7 +1164,7 @@ class RaidModule:
                 raid.title = title.strip()
             if new_start_at is not None:
                 raid.start_at = new_start_at
-            self.store.save()
+            await self.store.save_async()
 
         await self.refresh_raid_message(raid_id)
 
@@ -1187,7 +1186,7 @@ class RaidModule:
             if not raid:
                 return False, "Raid introuvable."
             raid.ping_done = True
-            self.store.save()
+            await self.store.save_async()
 
         await self.refresh_raid_message(raid_id)
         return True, "🔒 Raid fermé."
@@ -1232,7 +1231,7 @@ class RaidModule:
                 if name not in self.store.templates:
                     return await interaction.response.send_message("Template introuvable.", ephemeral=True)
                 del self.store.templates[name]
-                self.store.save()
+                await self.store.save_async()
             await interaction.response.send_message(f"🗑️ Template **{name}** supprimé.", ephemeral=True)
 
         @comp_delete.on_autocomplete("name")
@@ -1324,7 +1323,7 @@ class RaidModule:
                     raid.message_id = msg.id
                     raid.thread_id = thread.id if thread else None
                     self.store.raids[raid_id] = raid
-                    self.store.save()
+                    await self.store.save_async()
 
                 try:
                     self.bot.add_view(view, message_id=msg.id)
@@ -1368,9 +1367,9 @@ class RaidModule:
                 async def _confirm(confirm_interaction: nextcord.Interaction):
                     ok, message = await _publish_raid(confirm_interaction, title, description, extra_message, prep_minutes, cleanup_minutes)
                     if ok:
-                        await confirm_interaction.response.edit_message(content=message, view=None)
+                        await confirm_interaction.edit_original_message(content=message, view=None)
                     else:
-                        await confirm_interaction.response.send_message(f"⛔ {message}", ephemeral=True)
+                        await confirm_interaction.followup.send(f"⛔ {message}", ephemeral=True)
 
                 view = ConfirmView(owner_id=interaction.user.id, on_confirm=_confirm)
                 await modal_interaction.response.send_message(summary, ephemeral=True, view=view)
@@ -1455,16 +1454,13 @@ class RaidModule:
             async def _close_from_assistant(confirm_interaction: nextcord.Interaction, raid_id: str):
                 ok, message = await self._close_raid_now(raid_id)
                 if ok:
-                    await confirm_interaction.response.edit_message(content=message, view=None)
+                    await confirm_interaction.edit_original_message(content=message, view=None)
                 else:
-                    await confirm_interaction.response.send_message(f"⛔ {message}", ephemeral=True)
+                    await confirm_interaction.followup.send(f"⛔ {message}", ephemeral=True)
 
             async def _edit_from_assistant(confirm_interaction: nextcord.Interaction, raid_id: str, title: str, start: str):
                 ok, message = await self._edit_raid_data(raid_id, title=title, start=start)
-                if ok:
-                    await confirm_interaction.response.send_message(message, ephemeral=True)
-                else:
-                    await confirm_interaction.response.send_message(f"⛔ {message}", ephemeral=True)
+                await confirm_interaction.followup.send(message if ok else f"⛔ {message}", ephemeral=True)
 
             view = RaidAssistantView(owner_id=interaction.user.id, options=options, on_close=_close_from_assistant, on_edit=_edit_from_assistant)
             await interaction.response.send_message(view.render_content(), view=view, ephemeral=True)
@@ -1539,8 +1535,10 @@ class RaidModule:
                 players = list(raid.last_voice_present_ids or [])
                 if not players:
                     players = sorted([uid for uid in raid.signups.keys() if uid not in raid.absent])
+                seen = set(players)
                 for uid in parse_ids(add_players):
-                    if uid not in players:
+                    if uid not in seen:
+                        seen.add(uid)
                         players.append(uid)
                 to_remove = set(parse_ids(remove_players))
                 players = [uid for uid in players if uid not in to_remove]
@@ -1658,11 +1656,11 @@ class RaidModule:
                         raid_obj = self.mod.store.raids.get(data.get("raid_id", ""))
                         payouts = data.get("payouts", {})
                         if inter.guild and payouts:
-                            async with self.mod.store.lock:
-                                for uid, amt in payouts.items():
-                                    cur = self.mod.store.bank_get_balance(inter.guild.id, int(uid))
-                                    self.mod.store.bank_set_balance(inter.guild.id, int(uid), cur + int(amt))
-                                self.mod.store.save()
+                            async with self.mod.store.bank_lock(inter.guild.id):
+                                gains = {int(uid): int(amt) for uid, amt in payouts.items()}
+                                balances = self.mod.store.bank_get_balances(inter.guild.id, list(gains))
+                                self.mod.store.bank_set_balances(inter.guild.id, {uid: balances[uid] + amt for uid, amt in gains.items()})
+                                await self.mod.store.bank_save_async()
 
                         if raid_obj:
                             await self.mod._cleanup_temp_role_after_split(raid_obj)
@@ -1,8 +1,9 @@
 import asyncio
 import io
+import logging
 import re
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 import nextcord
 from nextcord.ext import commands
@@ -17,6 +18,8 @@ TICKET_MODE_CHANNEL = "private_channel"
 OPEN_STYLE_MESSAGE = "message"
 OPEN_STYLE_BUTTON = "button"
 
+log = logging.getLogger("albionbot.tickets")
+
 
 class TicketOpenLauncherButton(nextcord.ui.Button):
     def __init__(self, module: "TicketModule"):
@@ -83,6 +86,8 @@ class TicketModule:
         self.store = store
         self.cfg = cfg
         self._persistent_views_registered = False
+        # Strong refs to fire-and-forget log uploads until they finish.
+        self._log_tasks: Set[asyncio.Task] = set()
         self._register_commands()
 
     def register_persistent_views(self) -> None:
@@ -100,9 +105,9 @@ class TicketModule:
         conf = self.store.get_ticket_config(guild_id)
         raw_types = conf.get("ticket_types", {})
         out: Dict[str, Dict[str, object]] = {}
-        if isinstance(raw_types, dict):
+        if isinstance(raw_types, Mapping):
             for key, data in raw_types.items():
-                if not isinstance(data, dict):
+                if not isinstance(data, Mapping):
                     continue
                 safe_key = self._slugify_type_key(str(key))
                 if not safe_key:
@@ -208,9 +213,9 @@ class TicketModule:
                         content=f"[CLOSE_REASON] {clean_reason}",
                     ),
                 )
-            self.store.save()
+            await self.store.save_async()
 
-        await self._send_ticket_log(interaction.guild, ticket, interaction.user.id, reason=clean_reason)
+        self._spawn_ticket_log(interaction.guild, ticket, interaction.user.id, reason=clean_reason)
 
         if isinstance(interaction.channel, nextcord.Thread):
             await interaction.response.edit_message(content="✅ Ticket fermé. Archivage du thread...", view=None)
@@ -357,7 +362,7 @@ class TicketModule:
 
         async with self.store.lock:
             self.store.ticket_create_record(record)
-            self.store.save()
+            await self.store.save_async()
 
         target = thread if thread is not None else channel
         support_mentions = " ".join(f"<@&{rid}>" for rid in support_role_ids) or "Aucun rôle support"
@@ -473,7 +478,7 @@ class TicketModule:
 
             async with self.store.lock:
                 self._save_ticket_types(interaction.guild.id, all_types)
-                self.store.save()
+                await self.store.save_async()
 
             mentions = " ".join(f"<@&{rid}>" for rid in role_ids) if role_ids else "aucun"
             await interaction.response.send_message(
@@ -502,7 +507,7 @@ class TicketModule:
 
             async with self.store.lock:
                 self._save_ticket_types(interaction.guild.id, all_types)
-                self.store.save()
+                await self.store.save_async()
 
             await interaction.response.send_message(f"✅ Type `{safe_key}` supprimé.", ephemeral=True)
 
@@ -529,7 +534,7 @@ class TicketModule:
 
             async with self.store.lock:
                 self.store.set_ticket_config(interaction.guild.id, mode=mode)
-                self.store.save()
+                await self.store.save_async()
 
             await interaction.response.send_message(f"✅ Mode ticket configuré sur `{mode}`.", ephemeral=True)
 
@@ -552,7 +557,7 @@ class TicketModule:
                 ticket_types = self._all_ticket_types(interaction.guild.id)
                 ticket_types["default"]["category_id"] = category.id if category else None
                 self._save_ticket_types(interaction.guild.id, ticket_types)
-                self.store.save()
+                await self.store.save_async()
 
             if category:
                 await interaction.response.send_message(f"✅ Catégorie ticket définie sur {category.mention}.", ephemeral=True)
@@ -584,7 +589,7 @@ class TicketModule:
                 ticket_types = self._all_ticket_types(interaction.guild.id)
                 ticket_types["default"]["support_role_ids"] = role_ids
                 self._save_ticket_types(interaction.guild.id, ticket_types)
-                self.store.save()
+                await self.store.save_async()
 
             if role_ids:
                 mentions = " ".join(f"<@&{rid}>" for rid in role_ids)
@@ -607,7 +612,7 @@ class TicketModule:
 
             async with self.store.lock:
                 self.store.set_ticket_config(interaction.guild.id, open_style=style)
-                self.store.save()
+                await self.store.save_async()
 
             await interaction.response.send_message(f"✅ Style d'ouverture configuré sur `{style}`.", ephemeral=True)
 
@@ -623,7 +628,7 @@ class TicketModule:
 
             async with self.store.lock:
                 self.store.set_ticket_config(interaction.guild.id, log_channel_id=(channel.id if channel else None))
-                self.store.save()
+                await self.store.save_async()
 
             if channel:
                 await interaction.response.send_message(f"✅ Logs ticket configurés sur {channel.mention}.", ephemeral=True)
@@ -719,6 +724,17 @@ class TicketModule:
                 lines.append("  attachments: " + ", ".join(a.get("url", "") for a in snap.attachments if a.get("url")))
         return "\n".join(lines)
 
+    def _spawn_ticket_log(self, guild: nextcord.Guild, ticket: TicketRecord, closed_by: int, reason: str = "") -> None:
+        """Send the close log in the background so it does not delay the interaction reply."""
+        task = asyncio.create_task(self._send_ticket_log(guild, ticket, closed_by, reason=reason))
+        self._log_tasks.add(task)
+        task.add_done_callback(self._on_ticket_log_done)
+
+    def _on_ticket_log_done(self, task: asyncio.Task) -> None:
+        self._log_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Failed to send ticket log", exc_info=task.exception())
+
     async def _send_ticket_log(self, guild: nextcord.Guild, ticket: TicketRecord, closed_by: int, reason: str = "") -> bool:
         conf = self.store.get_ticket_config(guild.id)
         log_channel_id = int(conf.get("log_channel_id") or 0)
@@ -382,6 +382,65 @@ class BankDB:
                 (guild_id, user_id, int(balance), now)
             )
 
+    def get_balances(self, guild_id: int, user_ids: List[int]) -> Dict[int, int]:
+        """Balances for several users in one query; missing users map to 0."""
+        out = {int(uid): 0 for uid in user_ids}
+        if not out:
+            return out
+        ids = list(out)
+        if self.kind == "postgres":
+            rows = self._fetchall(
+                "SELECT user_id, balance FROM bank_balances WHERE guild_id = %s AND user_id = ANY(%s);",
+                (guild_id, ids)
+            )
+        else:
+            rows = []
+            # Stay under SQLite's bound-parameter limit on old builds.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows += self._fetchall(
+                    f"SELECT user_id, balance FROM bank_balances WHERE guild_id = ? AND user_id IN ({','.join('?' * len(chunk))});",
+                    (guild_id, *chunk)
+                )
+        for r in rows:
+            out[int(r["user_id"])] = int(r["balance"])
+        return out
+
+    def set_balances(self, guild_id: int, balances: Dict[int, int]) -> None:
+        """Upsert several balances in one transaction: all of them or none."""
+        if not balances:
+            return
+        now = int(time.time())
+        params = [(guild_id, int(uid), int(bal), now) for uid, bal in balances.items()]
+        if self.kind == "postgres":
+            def run(conn):
+                # The connection autocommits; group the rows explicitly.
+                with conn.transaction(), conn.cursor() as cur:
+                    cur.executemany(
+                        """
+                        INSERT INTO bank_balances(guild_id, user_id, balance, updated_at)
+                        VALUES (%s, %s, %s, %s)
+                        ON CONFLICT (guild_id, user_id)
+                        DO UPDATE SET balance = EXCLUDED.balance, updated_at = EXCLUDED.updated_at;
+                        """,
+                        params
+                    )
+
+            self._run_postgres(run)
+        else:
+            assert self._sqlite_conn is not None
+            # Commits on success, rolls back the rows already written on error.
+            with self._sqlite_conn:
+                self._sqlite_conn.executemany(
+                    """
+                    INSERT INTO bank_balances(guild_id, user_id, balance, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(guild_id, user_id)
+                    DO UPDATE SET balance = excluded.balance, updated_at = excluded.updated_at;
+                    """,
+                    params
+                )
+
     def delete_balance(self, guild_id: int, user_id: int) -> bool:
         if self.kind == "postgres":
             def run(conn):
@@ -1,10 +1,22 @@
 from __future__ import annotations
 import os
+import sys
 import json
+import mmap
 import time
 import asyncio
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Set, Literal, Tuple
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Deque, Dict, FrozenSet, List, Mapping, Optional, Set, Literal, Tuple, Union
+
+# Optional faster JSON codec; the stdlib json module is used when missing.
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
 
 RaidStatus = Literal["OPEN", "PINGED", "CLOSED"]
 BankActionType = Literal["add", "remove", "add_split", "remove_split"]
@@ -13,9 +25,41 @@ TicketRecordStatus = Literal["open", "closed", "deleted"]
 RaidCommandType = Literal["open_raid_from_template"]
 RaidCommandStatus = Literal["pending", "delivered", "failed"]
 STATE_DB_KEY = "bot_state_v1"
+_TICKET_STATUSES: Tuple[TicketRecordStatus, ...] = ("open", "closed", "deleted")
 
+log = logging.getLogger("albionbot.store")
 
-@dataclass
+# Shared read-only stand-in for missing sections while loading.
+_EMPTY_MAP: Mapping = MappingProxyType({})
+
+
+def _json_dumps(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, str]) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _section(raw: Mapping, key: str) -> Mapping:
+    value = raw.get(key)
+    return value if isinstance(value, dict) else _EMPTY_MAP
+
+
+def _freeze(value: object) -> object:
+    """Read-only copy of a JSON-like value: dicts become MappingProxyType, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(slots=True)
 class CompRole:
     key: str
     label: str
@@ -24,7 +68,7 @@ class CompRole:
     required_role_ids: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompTemplate:
     name: str
     description: str
@@ -35,7 +79,7 @@ class CompTemplate:
     roles: List[CompRole] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Signup:
     user_id: int
     role_key: str
@@ -44,7 +88,7 @@ class Signup:
     joined_at: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class RaidEvent:
     raid_id: str
     template_name: str
@@ -77,7 +121,7 @@ class RaidEvent:
     dm_notify_users: Set[int] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class RaidCommand:
     command_id: str
     command_type: RaidCommandType
@@ -92,7 +136,7 @@ class RaidCommand:
     delivered_at: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BankAction:
     action_id: str
     guild_id: int
@@ -105,7 +149,7 @@ class BankAction:
     undone_at: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketConfig:
     guild_id: int
     creation_mode: TicketCreationMode
@@ -118,7 +162,7 @@ class TicketConfig:
     ticket_types: Dict[str, TicketTypeConfig] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketRecord:
     ticket_id: str
     guild_id: int
@@ -133,7 +177,7 @@ class TicketRecord:
     deleted_at: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketMessageSnapshot:
     message_id: int
     author_id: int
@@ -145,7 +189,7 @@ class TicketMessageSnapshot:
     created_at: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketTypeConfig:
     key: str
     label: str
@@ -154,11 +198,175 @@ class TicketTypeConfig:
     category_id: Optional[int] = None
 
 
+# Hand-written counterparts of dataclasses.asdict: no field reflection and
+# no deepcopy, every field is a scalar or a flat container.
+def _comp_role_to_dict(r: CompRole) -> Dict:
+    return {
+        "key": r.key,
+        "label": r.label,
+        "slots": r.slots,
+        "ip_required": r.ip_required,
+        "required_role_ids": list(r.required_role_ids),
+    }
+
+
+def _signup_to_dict(s: Signup) -> Dict:
+    return {
+        "user_id": s.user_id,
+        "role_key": s.role_key,
+        "status": s.status,
+        "ip": s.ip,
+        "joined_at": s.joined_at,
+    }
+
+
+def _ticket_record_to_dict(rec: TicketRecord) -> Dict:
+    return {
+        "ticket_id": rec.ticket_id,
+        "guild_id": rec.guild_id,
+        "owner_user_id": rec.owner_user_id,
+        "ticket_type_key": rec.ticket_type_key,
+        "channel_id": rec.channel_id,
+        "thread_id": rec.thread_id,
+        "status": rec.status,
+        "created_at": rec.created_at,
+        "updated_at": rec.updated_at,
+        "closed_at": rec.closed_at,
+        "deleted_at": rec.deleted_at,
+    }
+
+
+def _ticket_snapshot_to_dict(snap: TicketMessageSnapshot) -> Dict:
+    return {
+        "message_id": snap.message_id,
+        "author_id": snap.author_id,
+        "author_name": snap.author_name,
+        "author_avatar_url": snap.author_avatar_url,
+        "content": snap.content,
+        "embeds": snap.embeds,
+        "attachments": snap.attachments,
+        "created_at": snap.created_at,
+    }
+
+
+def _decode_comp_role(r: Dict) -> CompRole:
+    return CompRole(
+        key=sys.intern(r["key"]),
+        label=r["label"],
+        slots=int(r["slots"]),
+        ip_required=bool(r.get("ip_required", False)),
+        required_role_ids=list(map(int, r.get("required_role_ids") or ())),
+    )
+
+
+def _decode_template(t: Dict, now: int) -> CompTemplate:
+    return CompTemplate(
+        name=t["name"],
+        description=t.get("description", ""),
+        created_by=int(t["created_by"]),
+        content_type=sys.intern(t.get("content_type", "pvp")),
+        created_at=int(t.get("created_at", now)),
+        raid_required_role_ids=list(map(int, t.get("raid_required_role_ids") or ())),
+        roles=[_decode_comp_role(r) for r in t.get("roles") or ()],
+    )
+
+
+def _decode_signup(uid: int, s: Dict, now: int) -> Signup:
+    return Signup(
+        user_id=uid,
+        role_key=sys.intern(s["role_key"]),
+        status=sys.intern(s.get("status", "main")),
+        ip=s.get("ip"),
+        joined_at=int(s.get("joined_at", now)),
+    )
+
+
+def _optional_int(value: object) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+def _decode_raid(r: Dict, now: int) -> RaidEvent:
+    return RaidEvent(
+        raid_id=r["raid_id"],
+        template_name=r["template_name"],
+        title=r["title"],
+        description=r.get("description", ""),
+        extra_message=r.get("extra_message", ""),
+        start_at=int(r["start_at"]),
+        created_by=int(r["created_by"]),
+        created_at=int(r.get("created_at", now)),
+        channel_id=_optional_int(r.get("channel_id")),
+        message_id=_optional_int(r.get("message_id")),
+        thread_id=_optional_int(r.get("thread_id")),
+        voice_channel_id=_optional_int(r.get("voice_channel_id")),
+        signups={int(uid_str): _decode_signup(int(uid_str), s, now) for uid_str, s in _section(r, "signups").items()},
+        absent=set(map(int, r.get("absent") or ())),
+        prep_minutes=int(r.get("prep_minutes", 10)),
+        cleanup_minutes=int(r.get("cleanup_minutes", 30)),
+        temp_role_id=r.get("temp_role_id"),
+        prep_done=bool(r.get("prep_done", False)),
+        ping_done=bool(r.get("ping_done", False)),
+        voice_check_done=bool(r.get("voice_check_done", False)),
+        cleanup_done=bool(r.get("cleanup_done", False)),
+        last_voice_present_ids=list(map(int, r.get("last_voice_present_ids") or ())),
+        dm_notify_users=set(map(int, r.get("dm_notify_users") or ())),
+    )
+
+
+def _decode_bank_action(a: Dict) -> BankAction:
+    return BankAction(
+        action_id=a["action_id"],
+        guild_id=int(a["guild_id"]),
+        actor_id=int(a["actor_id"]),
+        created_at=int(a["created_at"]),
+        action_type=sys.intern(a["action_type"]),
+        deltas={int(uid): int(delta) for uid, delta in a["deltas"].items()},
+        note=a.get("note", ""),
+        undone=bool(a.get("undone", False)),
+        undone_at=a.get("undone_at"),
+    )
+
+
+def _decode_ticket_record(ticket_id: str, rec: Dict, now: int) -> TicketRecord:
+    return TicketRecord(
+        ticket_id=str(rec.get("ticket_id", ticket_id)),
+        guild_id=int(rec["guild_id"]),
+        owner_user_id=int(rec["owner_user_id"]),
+        ticket_type_key=sys.intern(str(rec.get("ticket_type_key", "default"))),
+        channel_id=_optional_int(rec.get("channel_id")),
+        thread_id=_optional_int(rec.get("thread_id")),
+        status=sys.intern(rec.get("status", "open")),
+        created_at=int(rec.get("created_at", now)),
+        updated_at=int(rec.get("updated_at", rec.get("created_at", now))),
+        closed_at=rec.get("closed_at"),
+        deleted_at=rec.get("deleted_at"),
+    )
+
+
+def _decode_ticket_snapshot(snap: Dict, now: int) -> TicketMessageSnapshot:
+    # Older transcripts used id/author/message/text/timestamp/username/avatar_url.
+    content_raw = snap.get("content")
+    if content_raw is None:
+        content_raw = snap.get("message", snap.get("text", ""))
+    return TicketMessageSnapshot(
+        message_id=int(snap.get("message_id", snap.get("id", 0)) or 0),
+        author_id=int(snap.get("author_id", snap.get("author", 0)) or 0),
+        author_name=str(snap.get("author_name", snap.get("username", ""))),
+        author_avatar_url=str(snap.get("author_avatar_url", snap.get("avatar_url", ""))),
+        content=str(content_raw or ""),
+        # Freshly decoded lists: no need to copy them.
+        embeds=snap.get("embeds") or [],
+        attachments=snap.get("attachments") or [],
+        created_at=int(snap.get("created_at", snap.get("timestamp", now))),
+    )
+
+
 class Store:
     def __init__(self, path: str, bank_action_log_limit: int = 500, bank_database_url: str = "", bank_sqlite_path: str = "data/bank.sqlite3"):
         self.path = path
         self.bank_action_log_limit = bank_action_log_limit
         self.lock = asyncio.Lock()
+        self._guild_locks: Dict[int, asyncio.Lock] = {}
 
         self.bank_db = None
         self._bank_migrated_from_json = False
@@ -179,16 +387,52 @@ class Store:
         self.raids: Dict[str, RaidEvent] = {}
         self.guild_permissions: Dict[int, Dict[str, List[int]]] = {}
         self.guild_user_permissions: Dict[int, Dict[str, List[int]]] = {}
+        # (guild_id, permission_key) -> frozenset of the ids above, built on
+        # first permission check; cleared when the lists are replaced.
+        self._permission_role_sets: Dict[Tuple[int, str], FrozenSet[int]] = {}
+        self._permission_user_sets: Dict[Tuple[int, str], FrozenSet[int]] = {}
         self.raid_commands: Dict[str, RaidCommand] = {}
         self.bank_balances: Dict[int, Dict[int, int]] = {}
-        self.bank_actions: Dict[int, List[BankAction]] = {}
+        # Bounded per guild: the oldest actions fall off past bank_action_log_limit.
+        self.bank_actions: Dict[int, Deque[BankAction]] = {}
+        # (guild_id, actor_id) -> that actor's latest action still in the log
+        # and not undone.
+        self._bank_last_action_by_actor: Dict[Tuple[int, int], BankAction] = {}
+        # action_id -> action, for every action still in the log.
+        self._bank_action_by_id: Dict[str, BankAction] = {}
 
         self.ticket_configs: Dict[int, TicketConfig] = {}
         self.ticket_records: Dict[str, TicketRecord] = {}
         self.ticket_messages: Dict[str, List[TicketMessageSnapshot]] = {}
-        self.ticket_by_user: Dict[int, Dict[int, Dict[TicketRecordStatus, Set[str]]]] = {}
+        # Transcripts as loaded, decoded on first access (see _ticket_messages_for).
+        self._ticket_messages_raw: Dict[str, List[Dict]] = {}
+        # (guild_id, owner_user_id, status) -> ticket ids; status None holds
+        # the user's tickets in every status.
+        self._ticket_index: Dict[Tuple[int, int, Optional[str]], Set[str]] = {}
+        # channel_id / thread_id -> ticket ids. Thread-mode tickets share
+        # their parent channel, hence several ids per channel.
+        self._ticket_by_channel: Dict[int, Dict[str, None]] = {}
+        self._ticket_by_thread: Dict[int, Dict[str, None]] = {}
+        # ticket_id -> position in ticket_records, so index hits resolve in
+        # the order a scan of the records would find them.
+        self._ticket_order: Dict[str, int] = {}
+        self._ticket_next_order = 0
+        # guild_id -> open ticket ids, in creation order.
+        self._ticket_open_by_guild: Dict[int, Dict[str, None]] = {}
+        self._ticket_config_cache: Dict[int, Mapping[str, object]] = {}
         self.dashboard_user_profiles: Dict[int, Dict[str, Dict]] = {}
         self._last_state_fingerprint: str = ""
+        self._last_saved_payload: Optional[List[bytes]] = None
+        self._write_lock = threading.Lock()
+        self._write_seq = 0
+        self._written_seq = 0
+        self._writes_in_flight = 0
+        self._save_requested = False
+        self._save_task: Optional[asyncio.Task] = None
+        # Seconds request_save() waits so a burst of mutations shares one write.
+        self.save_delay = 0.25
+        self._raid_json_cache: Dict[str, Tuple[Dict, bytes]] = {}
+        self._ticket_messages_json_cache: Dict[str, Tuple[List, int, bytes]] = {}
 
         self.load()
         if self.bank_db and (self._bank_migrated_from_json or self._state_migrated_from_json):
@@ -206,6 +450,9 @@ class Store:
             return "file:missing"
 
     def reload_if_changed(self) -> bool:
+        # Our own write in flight, or unsaved changes waiting to be written.
+        if self._writes_in_flight or self._save_requested:
+            return False
         current = self._compute_state_fingerprint()
         if current == self._last_state_fingerprint:
             return False
@@ -217,94 +464,37 @@ class Store:
         if not os.path.exists(self.path):
             return {}
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.path, "rb") as f:
+                if orjson is None:
+                    return _json_loads(f.read())
+                # orjson parses straight from the mapped pages: no bytes copy
+                # of the whole file. (Empty files fail to map and land below.)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
         except Exception:
             return {}
 
     def _load_templates_and_raids(self, raw: Dict) -> None:
-        self.templates = {}
-        for name, t in raw.get("templates", {}).items():
-            roles: List[CompRole] = []
-            for r in t.get("roles", []):
-                roles.append(CompRole(
-                    key=r["key"],
-                    label=r["label"],
-                    slots=int(r["slots"]),
-                    ip_required=bool(r.get("ip_required", False)),
-                    required_role_ids=list(map(int, r.get("required_role_ids", []))),
-                ))
-            self.templates[name] = CompTemplate(
-                name=t["name"],
-                description=t.get("description", ""),
-                created_by=int(t["created_by"]),
-                content_type=t.get("content_type", "pvp"),
-                created_at=int(t.get("created_at", int(time.time()))),
-                raid_required_role_ids=list(map(int, t.get("raid_required_role_ids", []))),
-                roles=roles,
-            )
-
-        self.raids = {}
-        for rid, r in raw.get("raids", {}).items():
-            signups: Dict[int, Signup] = {}
-            for uid_str, s in r.get("signups", {}).items():
-                uid = int(uid_str)
-                signups[uid] = Signup(
-                    user_id=uid,
-                    role_key=s["role_key"],
-                    status=s.get("status", "main"),
-                    ip=s.get("ip"),
-                    joined_at=int(s.get("joined_at", int(time.time()))),
-                )
-
-            self.raids[rid] = RaidEvent(
-                raid_id=r["raid_id"],
-                template_name=r["template_name"],
-                title=r["title"],
-                description=r.get("description", ""),
-                extra_message=r.get("extra_message", ""),
-                start_at=int(r["start_at"]),
-                created_by=int(r["created_by"]),
-                created_at=int(r.get("created_at", int(time.time()))),
-                channel_id=(int(r.get("channel_id")) if r.get("channel_id") is not None else None),
-                message_id=(int(r.get("message_id")) if r.get("message_id") is not None else None),
-                thread_id=(int(r.get("thread_id")) if r.get("thread_id") is not None else None),
-                voice_channel_id=(int(r.get("voice_channel_id")) if r.get("voice_channel_id") is not None else None),
-                signups=signups,
-                absent=set(map(int, r.get("absent", []))),
-                prep_minutes=int(r.get("prep_minutes", 10)),
-                cleanup_minutes=int(r.get("cleanup_minutes", 30)),
-                temp_role_id=r.get("temp_role_id"),
-                prep_done=bool(r.get("prep_done", False)),
-                ping_done=bool(r.get("ping_done", False)),
-                voice_check_done=bool(r.get("voice_check_done", False)),
-                cleanup_done=bool(r.get("cleanup_done", False)),
-                last_voice_present_ids=list(map(int, r.get("last_voice_present_ids", []))),
-                dm_notify_users=set(map(int, r.get("dm_notify_users", []))),
-            )
+        now = int(time.time())
+        self.templates = {name: _decode_template(t, now) for name, t in _section(raw, "templates").items()}
+        self.raids = {rid: _decode_raid(r, now) for rid, r in _section(raw, "raids").items()}
 
-        self.guild_permissions = {}
-        for gid_str, perm_map in raw.get("guild_permissions", {}).items():
-            gid = int(gid_str)
-            if not isinstance(perm_map, dict):
-                continue
-            out_map: Dict[str, List[int]] = {}
-            for perm_key, role_ids in perm_map.items():
-                out_map[str(perm_key)] = list(map(int, role_ids or []))
-            self.guild_permissions[gid] = out_map
+        self.guild_permissions = {
+            int(gid_str): {sys.intern(str(perm_key)): list(map(int, role_ids or ())) for perm_key, role_ids in perm_map.items()}
+            for gid_str, perm_map in _section(raw, "guild_permissions").items()
+            if isinstance(perm_map, dict)
+        }
 
-        self.guild_user_permissions = {}
-        for gid_str, perm_map in raw.get("guild_user_permissions", {}).items():
-            gid = int(gid_str)
-            if not isinstance(perm_map, dict):
-                continue
-            out_map: Dict[str, List[int]] = {}
-            for perm_key, user_ids in perm_map.items():
-                out_map[str(perm_key)] = list(map(int, user_ids or []))
-            self.guild_user_permissions[gid] = out_map
+        self.guild_user_permissions = {
+            int(gid_str): {sys.intern(str(perm_key)): list(map(int, user_ids or ())) for perm_key, user_ids in perm_map.items()}
+            for gid_str, perm_map in _section(raw, "guild_user_permissions").items()
+            if isinstance(perm_map, dict)
+        }
+        self._permission_role_sets.clear()
+        self._permission_user_sets.clear()
 
         self.raid_commands = {}
-        for command_id, cmd in raw.get("raid_commands", {}).items():
+        for command_id, cmd in _section(raw, "raid_commands").items():
             if not isinstance(cmd, dict):
                 continue
             self.raid_commands[str(command_id)] = RaidCommand(
@@ -312,17 +502,17 @@ class Store:
                 command_type=str(cmd.get("command_type", "open_raid_from_template")),
                 raid_id=str(cmd.get("raid_id", "")),
                 status=str(cmd.get("status", "pending")),
-                payload=dict(cmd.get("payload", {}) or {}),
+                payload=dict(cmd.get("payload") or _EMPTY_MAP),
                 attempts=int(cmd.get("attempts", 0)),
-                next_attempt_at=int(cmd.get("next_attempt_at", int(time.time()))),
+                next_attempt_at=int(cmd.get("next_attempt_at", now)),
                 last_error=str(cmd.get("last_error", "")),
-                created_at=int(cmd.get("created_at", int(time.time()))),
-                updated_at=int(cmd.get("updated_at", int(time.time()))),
+                created_at=int(cmd.get("created_at", now)),
+                updated_at=int(cmd.get("updated_at", now)),
                 delivered_at=(int(cmd.get("delivered_at")) if cmd.get("delivered_at") is not None else None),
             )
 
         self.ticket_configs = {}
-        for gid_str, ticket_cfg in raw.get("ticket_configs", {}).items():
+        for gid_str, ticket_cfg in _section(raw, "ticket_configs").items():
             gid = int(gid_str)
             if not isinstance(ticket_cfg, dict):
                 continue
@@ -330,7 +520,7 @@ class Store:
             category_id = ticket_cfg.get("category_id")
             open_style = str(ticket_cfg.get("open_style", "button"))
             default_category_id = int(category_id) if category_id is not None else None
-            default_support_roles = list(map(int, ticket_cfg.get("support_role_ids", [])))
+            default_support_roles = list(map(int, ticket_cfg.get("support_role_ids") or ()))
             self.ticket_configs[gid] = TicketConfig(
                 guild_id=gid,
                 creation_mode=mode if mode in {"private_thread", "private_channel"} else "private_channel",
@@ -348,63 +538,63 @@ class Store:
             )
 
         self.dashboard_user_profiles = {}
-        raw_profiles = raw.get("dashboard_user_profiles", {})
-        if isinstance(raw_profiles, dict):
-            for user_id_str, profile_map in raw_profiles.items():
-                try:
-                    user_id = int(user_id_str)
-                except (TypeError, ValueError):
-                    continue
-                if not isinstance(profile_map, dict):
-                    continue
-                normalized: Dict[str, Dict] = {}
-                for profile_key, profile_value in profile_map.items():
-                    if isinstance(profile_value, dict):
-                        normalized[str(profile_key)] = dict(profile_value)
-                if normalized:
-                    self.dashboard_user_profiles[user_id] = normalized
+        for user_id_str, profile_map in _section(raw, "dashboard_user_profiles").items():
+            try:
+                user_id = int(user_id_str)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(profile_map, dict):
+                continue
+            normalized: Dict[str, Dict] = {}
+            for profile_key, profile_value in profile_map.items():
+                if isinstance(profile_value, dict):
+                    normalized[str(profile_key)] = dict(profile_value)
+            if normalized:
+                self.dashboard_user_profiles[user_id] = normalized
 
 
     def _load_bank_legacy_from_raw(self, raw: Dict) -> None:
         self.bank_balances = {}
         self.bank_actions = {}
 
-        for gid_str, d in raw.get("bank_balances", {}).items():
+        for gid_str, d in _section(raw, "bank_balances").items():
             gid = int(gid_str)
             self.bank_balances[gid] = {int(uid): int(bal) for uid, bal in d.items()}
 
-        for gid_str, lst in raw.get("bank_actions", {}).items():
-            gid = int(gid_str)
-            actions: List[BankAction] = []
-            for a in lst:
-                actions.append(BankAction(
-                    action_id=a["action_id"],
-                    guild_id=int(a["guild_id"]),
-                    actor_id=int(a["actor_id"]),
-                    created_at=int(a["created_at"]),
-                    action_type=a["action_type"],
-                    deltas={int(uid): int(delta) for uid, delta in a["deltas"].items()},
-                    note=a.get("note", ""),
-                    undone=bool(a.get("undone", False)),
-                    undone_at=a.get("undone_at"),
-                ))
-            self.bank_actions[gid] = actions
+        for gid_str, lst in _section(raw, "bank_actions").items():
+            self.bank_actions[int(gid_str)] = deque(map(_decode_bank_action, lst), maxlen=self.bank_action_log_limit)
+        self._bank_rebuild_action_index()
+
+    def _bank_rebuild_action_index(self) -> None:
+        self._bank_last_action_by_actor = {}
+        self._bank_action_by_id = {}
+        for gid, actions in self.bank_actions.items():
+            for a in actions:
+                self._bank_action_by_id[a.action_id] = a
+                if not a.undone:
+                    self._bank_last_action_by_actor[(gid, a.actor_id)] = a
 
     def _load_tickets_from_raw(self, raw: Dict) -> None:
         self.ticket_configs = {}
         self.ticket_records = {}
         self.ticket_messages = {}
-        self.ticket_by_user = {}
+        self._ticket_messages_raw = {}
+        self._ticket_index = {}
+        self._ticket_by_channel = {}
+        self._ticket_by_thread = {}
+        self._ticket_open_by_guild = {}
+        self._ticket_order = {}
+        now = int(time.time())
 
-        ticket_raw = raw.get("tickets", {}) if isinstance(raw.get("tickets", {}), dict) else {}
+        ticket_raw = _section(raw, "tickets")
 
-        for gid_str, conf in ticket_raw.get("configs", {}).items():
+        for gid_str, conf in _section(ticket_raw, "configs").items():
             if not isinstance(conf, dict):
                 continue
             gid = int(gid_str)
             open_style = str(conf.get("open_style", "button"))
             type_map: Dict[str, TicketTypeConfig] = {}
-            for type_key, type_data in (conf.get("ticket_types", {}) or {}).items():
+            for type_key, type_data in _section(conf, "ticket_types").items():
                 if not isinstance(type_data, dict):
                     continue
                 key = str(type_key).strip().lower()
@@ -415,106 +605,187 @@ class Store:
                     key=key,
                     label=str(type_data.get("label", key.title()))[:100],
                     description=str(type_data.get("description", ""))[:100],
-                    support_role_ids=list(map(int, type_data.get("support_role_ids", []))),
+                    support_role_ids=list(map(int, type_data.get("support_role_ids") or ())),
                     category_id=int(category_id) if category_id is not None else None,
                 )
             if "default" not in type_map:
                 type_map["default"] = TicketTypeConfig(
                     key="default",
                     label="Support",
-                    support_role_ids=list(map(int, conf.get("support_role_ids", []))),
+                    support_role_ids=list(map(int, conf.get("support_role_ids") or ())),
                     category_id=conf.get("category_id"),
                 )
 
             self.ticket_configs[gid] = TicketConfig(
                 guild_id=gid,
-                creation_mode=conf.get("creation_mode", "private_channel"),
+                creation_mode=sys.intern(conf.get("creation_mode", "private_channel")),
                 category_id=conf.get("category_id"),
-                admin_role_ids=list(map(int, conf.get("admin_role_ids", []))),
-                support_role_ids=list(map(int, conf.get("support_role_ids", []))),
+                admin_role_ids=list(map(int, conf.get("admin_role_ids") or ())),
+                support_role_ids=list(map(int, conf.get("support_role_ids") or ())),
                 naming_format=conf.get("naming_format", "ticket-{user}"),
-                open_style=open_style if open_style in {"message", "button"} else "button",
+                open_style=sys.intern(open_style) if open_style in {"message", "button"} else "button",
                 log_channel_id=(int(conf["log_channel_id"]) if conf.get("log_channel_id") is not None else None),
                 ticket_types=type_map,
             )
 
-        for ticket_id, rec in ticket_raw.get("records", {}).items():
+        for ticket_id, rec in _section(ticket_raw, "records").items():
             if not isinstance(rec, dict):
                 continue
-            self.ticket_records[str(ticket_id)] = TicketRecord(
-                ticket_id=str(rec.get("ticket_id", ticket_id)),
-                guild_id=int(rec["guild_id"]),
-                owner_user_id=int(rec["owner_user_id"]),
-                ticket_type_key=str(rec.get("ticket_type_key", "default")),
-                channel_id=rec.get("channel_id"),
-                thread_id=rec.get("thread_id"),
-                status=rec.get("status", "open"),
-                created_at=int(rec.get("created_at", int(time.time()))),
-                updated_at=int(rec.get("updated_at", rec.get("created_at", int(time.time())))),
-                closed_at=rec.get("closed_at"),
-                deleted_at=rec.get("deleted_at"),
-            )
+            self.ticket_records[str(ticket_id)] = _decode_ticket_record(ticket_id, rec, now)
 
-        for ticket_id, snapshots in ticket_raw.get("messages", {}).items():
-            out: List[TicketMessageSnapshot] = []
-            for snap in snapshots or []:
-                if not isinstance(snap, dict):
-                    continue
-                message_id_raw = snap.get("message_id", snap.get("id", 0))
-                author_id_raw = snap.get("author_id", snap.get("author", 0))
-                content_raw = snap.get("content")
-                if content_raw is None:
-                    content_raw = snap.get("message", snap.get("text", ""))
-                out.append(TicketMessageSnapshot(
-                    message_id=int(message_id_raw or 0),
-                    author_id=int(author_id_raw or 0),
-                    author_name=str(snap.get("author_name", snap.get("username", ""))),
-                    author_avatar_url=str(snap.get("author_avatar_url", snap.get("avatar_url", ""))),
-                    content=str(content_raw or ""),
-                    embeds=list(snap.get("embeds", [])),
-                    attachments=list(snap.get("attachments", [])),
-                    created_at=int(snap.get("created_at", snap.get("timestamp", int(time.time())))),
-                ))
-            self.ticket_messages[str(ticket_id)] = out
-
-        by_user_raw = ticket_raw.get("by_user", {})
-        if isinstance(by_user_raw, dict) and by_user_raw:
-            for gid_str, users in by_user_raw.items():
-                if not isinstance(users, dict):
-                    continue
-                gid = int(gid_str)
-                self.ticket_by_user[gid] = {}
-                for uid_str, grouped in users.items():
-                    if not isinstance(grouped, dict):
-                        continue
-                    uid = int(uid_str)
-                    self.ticket_by_user[gid][uid] = {
-                        "open": set(map(str, grouped.get("open", []))),
-                        "closed": set(map(str, grouped.get("closed", []))),
-                        "deleted": set(map(str, grouped.get("deleted", []))),
-                    }
-        else:
-            self._ticket_rebuild_user_index()
+        for ticket_id, snapshots in _section(ticket_raw, "messages").items():
+            self._ticket_messages_raw[str(ticket_id)] = [snap for snap in snapshots or [] if isinstance(snap, dict)]
+
+        # The per-user index is derived state: rebuilt here, never persisted.
+        self._ticket_rebuild_user_index()
 
     def _ticket_rebuild_user_index(self) -> None:
-        self.ticket_by_user = {}
+        self._ticket_index = {}
+        self._ticket_by_channel = {}
+        self._ticket_by_thread = {}
+        self._ticket_open_by_guild = {}
+        self._ticket_order = {ticket_id: order for order, ticket_id in enumerate(self.ticket_records)}
+        self._ticket_next_order = len(self._ticket_order)
         for record in self.ticket_records.values():
             self._ticket_index_record(record)
+            self._ticket_index_channel_ref(record)
+
+    def _ticket_index_channel_ref(self, record: TicketRecord) -> None:
+        if record.channel_id is not None:
+            self._ticket_by_channel.setdefault(int(record.channel_id), {})[record.ticket_id] = None
+        if record.thread_id is not None:
+            self._ticket_by_thread.setdefault(int(record.thread_id), {})[record.ticket_id] = None
+
+    def _ticket_unindex_channel_ref(self, record: TicketRecord) -> None:
+        for index, ref in ((self._ticket_by_channel, record.channel_id), (self._ticket_by_thread, record.thread_id)):
+            if ref is None:
+                continue
+            ticket_ids = index.get(int(ref))
+            if ticket_ids is not None:
+                ticket_ids.pop(record.ticket_id, None)
+                if not ticket_ids:
+                    del index[int(ref)]
 
     def _ticket_index_record(self, record: TicketRecord) -> None:
         gid = int(record.guild_id)
         uid = int(record.owner_user_id)
-        if gid not in self.ticket_by_user:
-            self.ticket_by_user[gid] = {}
-        if uid not in self.ticket_by_user[gid]:
-            self.ticket_by_user[gid][uid] = {"open": set(), "closed": set(), "deleted": set()}
+        for status in _TICKET_STATUSES:
+            ticket_ids = self._ticket_index.get((gid, uid, status))
+            if ticket_ids is not None:
+                ticket_ids.discard(record.ticket_id)
+        self._ticket_index.setdefault((gid, uid, record.status), set()).add(record.ticket_id)
+        self._ticket_index.setdefault((gid, uid, None), set()).add(record.ticket_id)
+        if record.status == "open":
+            self._ticket_open_by_guild.setdefault(gid, {})[record.ticket_id] = None
+        else:
+            open_ids = self._ticket_open_by_guild.get(gid)
+            if open_ids is not None:
+                open_ids.pop(record.ticket_id, None)
+
+    def _serialize_raid(self, r: RaidEvent) -> Dict:
+        return {
+            "raid_id": r.raid_id,
+            "template_name": r.template_name,
+            "title": r.title,
+            "description": r.description,
+            "extra_message": r.extra_message,
+            "start_at": r.start_at,
+            "created_by": r.created_by,
+            "created_at": r.created_at,
+            "channel_id": r.channel_id,
+            "message_id": r.message_id,
+            "thread_id": r.thread_id,
+            "voice_channel_id": r.voice_channel_id,
+            "signups": {uid: _signup_to_dict(s) for uid, s in r.signups.items()},
+            # Sorted so an unchanged set always encodes the same way.
+            "absent": sorted(r.absent),
+            "prep_minutes": r.prep_minutes,
+            "cleanup_minutes": r.cleanup_minutes,
+            "temp_role_id": r.temp_role_id,
+            "prep_done": r.prep_done,
+            "ping_done": r.ping_done,
+            "voice_check_done": r.voice_check_done,
+            "cleanup_done": r.cleanup_done,
+            "last_voice_present_ids": list(r.last_voice_present_ids),
+            "dm_notify_users": sorted(r.dm_notify_users),
+        }
+
+    def _encode_raids(self, chunks: List[bytes]) -> None:
+        # Most raids are untouched between two saves: reuse their previous
+        # encoding when the serialized dict compares equal.
+        cache: Dict[str, Tuple[Dict, bytes]] = {}
+        sep = b"{"
+        for rid, r in self.raids.items():
+            data = self._serialize_raid(r)
+            cached = self._raid_json_cache.get(rid)
+            if cached is not None and cached[0] == data:
+                encoded = cached[1]
+            else:
+                encoded = _json_dumps(data)
+            cache[rid] = (data, encoded)
+            chunks += (sep, _json_dumps(rid), b":", encoded)
+            sep = b","
+        self._raid_json_cache = cache
+        chunks.append(b"{}" if sep == b"{" else b"}")
+
+    def _encode_ticket_messages(self, chunks: List[bytes]) -> None:
+        # Transcripts only grow through ticket_append_snapshot (undecoded ones
+        # never change), so a ticket whose list object is unchanged only needs
+        # its new tail encoded.
+        cache: Dict[str, Tuple[List, int, bytes]] = {}
+        transcripts = [(ticket_id, snapshots, False) for ticket_id, snapshots in self._ticket_messages_raw.items()]
+        transcripts += [(ticket_id, snapshots, True) for ticket_id, snapshots in self.ticket_messages.items()]
+        sep = b"{"
+        for ticket_id, snapshots, decoded in transcripts:
+            encoded = b""
+            count = 0
+            cached = self._ticket_messages_json_cache.get(ticket_id)
+            if cached is not None and cached[0] is snapshots and cached[1] <= len(snapshots):
+                _, count, encoded = cached
+            if count < len(snapshots):
+                tail = snapshots[count:]
+                fresh = b",".join(_json_dumps(_ticket_snapshot_to_dict(snap) if decoded else snap) for snap in tail)
+                encoded = encoded + b"," + fresh if encoded else fresh
+            cache[ticket_id] = (snapshots, len(snapshots), encoded)
+            chunks += (sep, _json_dumps(str(ticket_id)), b":[", encoded, b"]")
+            sep = b","
+        self._ticket_messages_json_cache = cache
+        chunks.append(b"{}" if sep == b"{" else b"}")
+
+    def _encode_runtime_state_chunks(self, extra: Optional[Dict] = None) -> List[bytes]:
+        # The document is kept as a list of chunks, mostly cached section
+        # encodings, so a file save never materializes the whole state at once.
+        raw = self._serialize_runtime_state(deferred=True)
+        raw.update(extra or {})
+        chunks: List[bytes] = []
+        sep = b"{"
+        for key, value in raw.items():
+            chunks += (sep, _json_dumps(key), b":")
+            sep = b","
+            if key == "raids":
+                self._encode_raids(chunks)
+            elif key == "tickets":
+                sub_sep = b"{"
+                for sub_key, sub_value in value.items():
+                    chunks += (sub_sep, _json_dumps(sub_key), b":")
+                    sub_sep = b","
+                    if sub_key == "messages":
+                        self._encode_ticket_messages(chunks)
+                    else:
+                        chunks.append(_json_dumps(sub_value))
+                chunks.append(b"}")
+            else:
+                chunks.append(_json_dumps(value))
+        chunks.append(b"}")
+        return chunks
 
-        for status in ["open", "closed", "deleted"]:
-            self.ticket_by_user[gid][uid][status].discard(record.ticket_id)
-        self.ticket_by_user[gid][uid][record.status].add(record.ticket_id)
+    def _encode_runtime_state(self, extra: Optional[Dict] = None) -> bytes:
+        return b"".join(self._encode_runtime_state_chunks(extra))
 
-    def _serialize_runtime_state(self) -> Dict:
-        raw = {"templates": {}, "raids": {}, "guild_permissions": {}, "guild_user_permissions": {}, "raid_commands": {}, "tickets": {"configs": {}, "records": {}, "messages": {}, "by_user": {}}, "dashboard_user_profiles": {}}
+    def _serialize_runtime_state(self, deferred: bool = False) -> Dict:
+        # With deferred=True the raids and ticket messages are left empty:
+        # _encode_runtime_state encodes those from its own caches.
+        raw = {"templates": {}, "raids": {}, "guild_permissions": {}, "guild_user_permissions": {}, "raid_commands": {}, "tickets": {"configs": {}, "records": {}, "messages": {}}, "dashboard_user_profiles": {}}
         for name, t in self.templates.items():
             raw["templates"][name] = {
                 "name": t.name,
@@ -523,41 +794,18 @@ class Store:
                 "content_type": t.content_type,
                 "created_at": t.created_at,
                 "raid_required_role_ids": t.raid_required_role_ids,
-                "roles": [asdict(r) for r in t.roles],
+                "roles": [_comp_role_to_dict(r) for r in t.roles],
             }
 
-        for rid, r in self.raids.items():
-            raw["raids"][rid] = {
-                "raid_id": r.raid_id,
-                "template_name": r.template_name,
-                "title": r.title,
-                "description": r.description,
-                "extra_message": r.extra_message,
-                "start_at": r.start_at,
-                "created_by": r.created_by,
-                "created_at": r.created_at,
-                "channel_id": r.channel_id,
-                "message_id": r.message_id,
-                "thread_id": r.thread_id,
-                "voice_channel_id": r.voice_channel_id,
-                "signups": {str(uid): asdict(s) for uid, s in r.signups.items()},
-                "absent": list(r.absent),
-                "prep_minutes": r.prep_minutes,
-                "cleanup_minutes": r.cleanup_minutes,
-                "temp_role_id": r.temp_role_id,
-                "prep_done": r.prep_done,
-                "ping_done": r.ping_done,
-                "voice_check_done": r.voice_check_done,
-                "cleanup_done": r.cleanup_done,
-                "last_voice_present_ids": list(r.last_voice_present_ids),
-                "dm_notify_users": list(r.dm_notify_users),
-            }
+        if not deferred:
+            for rid, r in self.raids.items():
+                raw["raids"][rid] = self._serialize_raid(r)
 
         for gid, perm_map in self.guild_permissions.items():
-            raw["guild_permissions"][str(gid)] = {k: list(map(int, v)) for k, v in perm_map.items()}
+            raw["guild_permissions"][gid] = {k: list(map(int, v)) for k, v in perm_map.items()}
 
         for gid, perm_map in self.guild_user_permissions.items():
-            raw["guild_user_permissions"][str(gid)] = {k: list(map(int, v)) for k, v in perm_map.items()}
+            raw["guild_user_permissions"][gid] = {k: list(map(int, v)) for k, v in perm_map.items()}
 
         for command_id, command in self.raid_commands.items():
             raw["raid_commands"][str(command_id)] = {
@@ -577,7 +825,7 @@ class Store:
         for gid, conf in self.ticket_configs.items():
             if isinstance(conf, dict):
                 mode = str(conf.get("mode", "private_channel"))
-                raw["tickets"]["configs"][str(gid)] = {
+                raw["tickets"]["configs"][gid] = {
                     "guild_id": int(gid),
                     "creation_mode": mode if mode in {"private_thread", "private_channel"} else "private_channel",
                     "category_id": conf.get("category_id"),
@@ -586,7 +834,7 @@ class Store:
                     "naming_format": "ticket-{user}",
                 }
             else:
-                raw["tickets"]["configs"][str(gid)] = {
+                raw["tickets"]["configs"][gid] = {
                     "guild_id": conf.guild_id,
                     "creation_mode": conf.creation_mode,
                     "category_id": conf.category_id,
@@ -608,25 +856,19 @@ class Store:
                 }
 
         for ticket_id, rec in self.ticket_records.items():
-            raw["tickets"]["records"][str(ticket_id)] = asdict(rec)
-
-        for ticket_id, snapshots in self.ticket_messages.items():
-            raw["tickets"]["messages"][str(ticket_id)] = [asdict(snap) for snap in snapshots]
-
-        for gid, users in self.ticket_by_user.items():
-            raw["tickets"]["by_user"][str(gid)] = {}
-            for uid, grouped in users.items():
-                raw["tickets"]["by_user"][str(gid)][str(uid)] = {
-                    "open": sorted(grouped["open"]),
-                    "closed": sorted(grouped["closed"]),
-                    "deleted": sorted(grouped["deleted"]),
-                }
+            raw["tickets"]["records"][str(ticket_id)] = _ticket_record_to_dict(rec)
+
+        if not deferred:
+            for ticket_id, raw_snapshots in self._ticket_messages_raw.items():
+                raw["tickets"]["messages"][str(ticket_id)] = raw_snapshots
+            for ticket_id, snapshots in self.ticket_messages.items():
+                raw["tickets"]["messages"][str(ticket_id)] = [_ticket_snapshot_to_dict(snap) for snap in snapshots]
 
         for user_id, profile_map in self.dashboard_user_profiles.items():
-            raw["dashboard_user_profiles"][str(user_id)] = {}
+            raw["dashboard_user_profiles"][user_id] = {}
             for profile_key, profile_value in profile_map.items():
                 if isinstance(profile_value, dict):
-                    raw["dashboard_user_profiles"][str(user_id)][str(profile_key)] = dict(profile_value)
+                    raw["dashboard_user_profiles"][user_id][str(profile_key)] = dict(profile_value)
         return raw
 
 
@@ -649,7 +891,15 @@ class Store:
     def set_permission_role_ids(self, guild_id: int, permission_key: str, role_ids: List[int]) -> None:
         if guild_id not in self.guild_permissions:
             self.guild_permissions[guild_id] = {}
-        self.guild_permissions[guild_id][permission_key] = list(map(int, role_ids))
+        self.guild_permissions[guild_id][sys.intern(permission_key)] = list(map(int, role_ids))
+        self._permission_role_sets.pop((guild_id, permission_key), None)
+
+    def get_permission_role_set(self, guild_id: int, permission_key: str) -> FrozenSet[int]:
+        key = (guild_id, permission_key)
+        role_set = self._permission_role_sets.get(key)
+        if role_set is None:
+            role_set = self._permission_role_sets[key] = frozenset(self.guild_permissions.get(guild_id, {}).get(permission_key, ()))
+        return role_set
 
     def get_permission_user_ids(self, guild_id: int, permission_key: str) -> List[int]:
         return list(self.guild_user_permissions.get(guild_id, {}).get(permission_key, []))
@@ -657,9 +907,25 @@ class Store:
     def set_permission_user_ids(self, guild_id: int, permission_key: str, user_ids: List[int]) -> None:
         if guild_id not in self.guild_user_permissions:
             self.guild_user_permissions[guild_id] = {}
-        self.guild_user_permissions[guild_id][permission_key] = list(map(int, user_ids))
-
-    def get_ticket_config(self, guild_id: int) -> Dict[str, object]:
+        self.guild_user_permissions[guild_id][sys.intern(permission_key)] = list(map(int, user_ids))
+        self._permission_user_sets.pop((guild_id, permission_key), None)
+
+    def get_permission_user_set(self, guild_id: int, permission_key: str) -> FrozenSet[int]:
+        key = (guild_id, permission_key)
+        user_set = self._permission_user_sets.get(key)
+        if user_set is None:
+            user_set = self._permission_user_sets[key] = frozenset(self.guild_user_permissions.get(guild_id, {}).get(permission_key, ()))
+        return user_set
+
+    def get_ticket_config(self, guild_id: int) -> Mapping[str, object]:
+        """Read-only config view for a guild, shared between callers; update it through set_ticket_config."""
+        cached = self._ticket_config_cache.get(guild_id)
+        if cached is None:
+            cached = _freeze(self._build_ticket_config(guild_id))
+            self._ticket_config_cache[guild_id] = cached
+        return cached
+
+    def _build_ticket_config(self, guild_id: int) -> Dict[str, object]:
         data = self.ticket_configs.get(guild_id)
         if data is None:
             return {
@@ -721,9 +987,9 @@ class Store:
             current = self.get_ticket_config(guild_id)
             raw_types = current.get("ticket_types", {})
             type_map: Dict[str, TicketTypeConfig] = {}
-            if isinstance(raw_types, dict):
+            if isinstance(raw_types, Mapping):
                 for type_key, type_data in raw_types.items():
-                    if not isinstance(type_data, dict):
+                    if not isinstance(type_data, Mapping):
                         continue
                     key = str(type_key).strip().lower()
                     if not key:
@@ -787,8 +1053,10 @@ class Store:
             conf.ticket_types = type_map
 
         self.ticket_configs[guild_id] = conf
+        self._ticket_config_cache.pop(guild_id, None)
 
     def load(self) -> None:
+        self._ticket_config_cache = {}
         file_raw = self._safe_read_json_file()
         raw_for_state = file_raw
 
@@ -796,7 +1064,7 @@ class Store:
             db_blob = self.bank_db.get_state_blob(STATE_DB_KEY)
             if db_blob:
                 try:
-                    raw_for_state = json.loads(db_blob)
+                    raw_for_state = _json_loads(db_blob)
                 except Exception:
                     raw_for_state = file_raw
             elif file_raw.get("templates") or file_raw.get("raids"):
@@ -804,10 +1072,15 @@ class Store:
 
         self._load_templates_and_raids(raw_for_state)
         self._load_tickets_from_raw(raw_for_state)
-        self._load_bank_legacy_from_raw(file_raw)
 
-        if self.bank_db is not None:
-            if self.bank_db.is_empty() and (self.bank_balances or self.bank_actions):
+        if self.bank_db is None:
+            self._load_bank_legacy_from_raw(file_raw)
+        else:
+            # Legacy bank sections are only parsed to seed an empty database;
+            # once migrated (or with nothing to migrate) they are skipped.
+            has_legacy_bank = file_raw.get("bank_storage") != "sql" and (file_raw.get("bank_balances") or file_raw.get("bank_actions"))
+            if has_legacy_bank and self.bank_db.is_empty():
+                self._load_bank_legacy_from_raw(file_raw)
                 try:
                     self.bank_db.import_from_json(self.bank_balances, self.bank_actions)
                     self._bank_migrated_from_json = True
@@ -815,42 +1088,165 @@ class Store:
                     pass
             self.bank_balances = {}
             self.bank_actions = {}
+            self._bank_rebuild_action_index()
 
+        # What is stored now is not necessarily our last write any more.
+        self._last_saved_payload = None
         self._last_state_fingerprint = self._compute_state_fingerprint()
 
-    def save(self) -> None:
-        raw = self._serialize_runtime_state()
+    def _serialize_legacy_bank(self) -> Dict:
+        # Encoded right away, so the live maps can be handed over as-is.
+        actions_raw: Dict[int, List[Dict]] = {}
+        for gid, actions in self.bank_actions.items():
+            actions_raw[gid] = [
+                {
+                    "action_id": a.action_id,
+                    "guild_id": a.guild_id,
+                    "actor_id": a.actor_id,
+                    "created_at": a.created_at,
+                    "action_type": a.action_type,
+                    "deltas": a.deltas,
+                    "note": a.note,
+                    "undone": a.undone,
+                    "undone_at": a.undone_at,
+                }
+                for a in actions
+            ]
+        return {"bank_balances": self.bank_balances, "bank_actions": actions_raw}
 
+    def _prepare_save(self) -> Optional[Tuple[List[bytes], List[bytes], Optional[str]]]:
+        """Encode the state for _write_state().
+
+        Returns the encoded chunks, the chunks to write to the file and, in
+        SQL mode, the blob to store; None when nothing changed.
+        """
         if self.bank_db is not None:
-            raw["bank_storage"] = "sql"
-            self.bank_db.set_state_blob(STATE_DB_KEY, json.dumps(raw, ensure_ascii=False))
+            data = self._encode_runtime_state_chunks({"bank_storage": "sql"})
         else:
-            raw["bank_balances"] = {}
-            raw["bank_actions"] = {}
-            for gid, d in self.bank_balances.items():
-                raw["bank_balances"][str(gid)] = {str(uid): bal for uid, bal in d.items()}
-            for gid, actions in self.bank_actions.items():
-                raw["bank_actions"][str(gid)] = []
-                for a in actions[-self.bank_action_log_limit:]:
-                    raw["bank_actions"][str(gid)].append({
-                        "action_id": a.action_id,
-                        "guild_id": a.guild_id,
-                        "actor_id": a.actor_id,
-                        "created_at": a.created_at,
-                        "action_type": a.action_type,
-                        "deltas": {str(uid): delta for uid, delta in a.deltas.items()},
-                        "note": a.note,
-                        "undone": a.undone,
-                        "undone_at": a.undone_at,
-                    })
-
-        base_dir = os.path.dirname(self.path) or "."
-        os.makedirs(base_dir, exist_ok=True)
-        tmp = self.path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(raw, f, ensure_ascii=False, indent=2)
-        os.replace(tmp, self.path)
-        self._last_state_fingerprint = self._compute_state_fingerprint()
+            data = self._encode_runtime_state_chunks(self._serialize_legacy_bank())
+
+        # Nothing changed since our last write and nobody else wrote since:
+        # skip the rewrite (and the reload it would trigger elsewhere). The
+        # SQL blob is not read back for this: a write from another process is
+        # picked up by reload_if_changed(), which clears _last_saved_payload.
+        if self._last_saved_payload == data and (
+            self.bank_db is not None or self._compute_state_fingerprint() == self._last_state_fingerprint
+        ):
+            return None
+
+        file_data = data
+        blob: Optional[str] = None
+        if self.bank_db is not None:
+            # The file mirrors the SQL blob byte for byte: one encode, two sinks.
+            joined = b"".join(data)
+            blob = joined.decode("utf-8")
+            file_data = [joined]
+        self._write_seq += 1
+        return data, file_data, blob
+
+    def _write_state(self, data: List[bytes], blob: Optional[str], seq: int) -> bool:
+        # May run in a worker thread: never let an older snapshot overwrite
+        # a newer one that landed first.
+        with self._write_lock:
+            if seq < self._written_seq:
+                return False
+            if blob is not None:
+                self.bank_db.set_state_blob(STATE_DB_KEY, blob)
+            base_dir = os.path.dirname(self.path) or "."
+            os.makedirs(base_dir, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.writelines(data)
+            os.replace(tmp, self.path)
+            self._written_seq = seq
+            return True
+
+    def _saved_fingerprint(self, blob: Optional[str]) -> str:
+        if blob is not None:
+            return f"db:{hash(blob)}"
+        return self._compute_state_fingerprint()
+
+    def save(self) -> None:
+        payload = self._prepare_save()
+        if payload is None:
+            return
+        data, file_data, blob = payload
+        self._write_state(file_data, blob, self._write_seq)
+        self._last_saved_payload = data
+        self._last_state_fingerprint = self._saved_fingerprint(blob)
+
+    async def save_async(self) -> None:
+        """Like save(), but the SQL blob and the state file are written from a worker thread.
+
+        Encoding stays on the event loop so the written snapshot is
+        consistent. Does not take self.lock: callers usually hold it.
+        """
+        payload = self._prepare_save()
+        if payload is None:
+            return
+        data, file_data, blob = payload
+        seq = self._write_seq
+        self._writes_in_flight += 1
+        try:
+            written = await asyncio.to_thread(self._write_state, file_data, blob, seq)
+        finally:
+            self._writes_in_flight -= 1
+        if written and seq == self._write_seq:
+            self._last_saved_payload = data
+            self._last_state_fingerprint = self._saved_fingerprint(blob)
+
+    def request_save(self) -> None:
+        """Schedule save_async() after save_delay; bursts collapse into one write."""
+        self._save_requested = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.get_running_loop().create_task(self._drain_save_requests())
+
+    async def _drain_save_requests(self) -> None:
+        while self._save_requested:
+            await asyncio.sleep(self.save_delay)
+            self._save_requested = False
+            try:
+                await self.save_async()
+            except Exception:
+                log.exception("Failed to save state")
+
+    async def flush(self) -> None:
+        """Wait for saves scheduled with request_save() to hit the disk."""
+        while self._save_task is not None and not self._save_task.done():
+            await self._save_task
+
+    def guild_lock(self, guild_id: int) -> asyncio.Lock:
+        """Lock for changes to one guild's data held outside the state file.
+
+        Only the SQL bank qualifies. Anything save() serialises or
+        reload_if_changed() replaces (raids, tickets, the legacy JSON bank)
+        stays under self.lock, so it is never written or swapped mid-change.
+        """
+        gid = int(guild_id)
+        guild_lock = self._guild_locks.get(gid)
+        if guild_lock is None:
+            guild_lock = self._guild_locks[gid] = asyncio.Lock()
+        return guild_lock
+
+    def bank_lock(self, guild_id: int) -> asyncio.Lock:
+        """Lock to hold while changing a guild's bank (see guild_lock)."""
+        if self.bank_db is None:
+            return self.lock
+        return self.guild_lock(guild_id)
+
+    async def bank_save_async(self) -> None:
+        """Persist bank changes made under bank_lock().
+
+        The SQL bank is already written; only the legacy JSON bank lives in
+        the state file.
+        """
+        if self.bank_db is None:
+            await self.save_async()
+
+    def drop_guild_lock(self, guild_id: int) -> None:
+        guild_lock = self._guild_locks.get(int(guild_id))
+        if guild_lock is not None and not guild_lock.locked():
+            del self._guild_locks[int(guild_id)]
 
     # Bank helpers
     def bank_get_balance(self, guild_id: int, user_id: int) -> int:
@@ -866,6 +1262,18 @@ class Store:
             self.bank_balances[guild_id] = {}
         self.bank_balances[guild_id][user_id] = bal
 
+    def bank_get_balances(self, guild_id: int, user_ids: List[int]) -> Dict[int, int]:
+        if self.bank_db is not None:
+            return self.bank_db.get_balances(guild_id, user_ids)
+        balances = self.bank_balances.get(guild_id, {})
+        return {uid: balances.get(uid, 0) for uid in user_ids}
+
+    def bank_set_balances(self, guild_id: int, balances: Dict[int, int]) -> None:
+        if self.bank_db is not None:
+            self.bank_db.set_balances(guild_id, balances)
+            return
+        self.bank_balances.setdefault(guild_id, {}).update(balances)
+
     def bank_delete_balance(self, guild_id: int, user_id: int) -> bool:
         if self.bank_db is not None:
             return self.bank_db.delete_balance(guild_id, user_id)
@@ -881,11 +1289,20 @@ class Store:
         if self.bank_db is not None:
             self.bank_db.append_action(action)
             return
-        if action.guild_id not in self.bank_actions:
-            self.bank_actions[action.guild_id] = []
-        self.bank_actions[action.guild_id].append(action)
-        if len(self.bank_actions[action.guild_id]) > self.bank_action_log_limit:
-            self.bank_actions[action.guild_id] = self.bank_actions[action.guild_id][-self.bank_action_log_limit:]
+        actions = self.bank_actions.get(action.guild_id)
+        if actions is None:
+            actions = self.bank_actions[action.guild_id] = deque(maxlen=self.bank_action_log_limit)
+        if actions.maxlen is not None and len(actions) >= actions.maxlen:
+            evicted = actions[0]
+            if self._bank_action_by_id.get(evicted.action_id) is evicted:
+                del self._bank_action_by_id[evicted.action_id]
+            key = (evicted.guild_id, evicted.actor_id)
+            if self._bank_last_action_by_actor.get(key) is evicted:
+                del self._bank_last_action_by_actor[key]
+        actions.append(action)
+        self._bank_action_by_id[action.action_id] = action
+        if not action.undone:
+            self._bank_last_action_by_actor[(action.guild_id, action.actor_id)] = action
 
     def bank_get_leaderboard(self, guild_id: int, limit: int, offset: int = 0) -> Tuple[List[Tuple[int, int]], int]:
         if self.bank_db is not None:
@@ -906,22 +1323,34 @@ class Store:
     def bank_find_last_action_for_actor(self, guild_id: int, actor_id: int) -> Optional[BankAction]:
         if self.bank_db is not None:
             return self.bank_db.find_last_action_for_actor(guild_id, actor_id)
-        actions = self.bank_actions.get(guild_id, [])
-        for a in reversed(actions):
+        key = (guild_id, actor_id)
+        action = self._bank_last_action_by_actor.get(key)
+        if action is not None and action.undone:
+            # Undone behind our back (callers may flip the flag directly).
+            action = self._bank_refresh_last_action(key)
+        return action
+
+    def _bank_refresh_last_action(self, key: Tuple[int, int]) -> Optional[BankAction]:
+        guild_id, actor_id = key
+        for a in reversed(self.bank_actions.get(guild_id, ())):
             if a.actor_id == actor_id and not a.undone:
+                self._bank_last_action_by_actor[key] = a
                 return a
+        self._bank_last_action_by_actor.pop(key, None)
         return None
 
     def bank_mark_action_undone(self, action_id: str, undone_at: int) -> None:
         if self.bank_db is not None:
             self.bank_db.mark_action_undone(action_id, undone_at)
             return
-        for actions in self.bank_actions.values():
-            for a in actions:
-                if a.action_id == action_id:
-                    a.undone = True
-                    a.undone_at = int(undone_at)
-                    return
+        action = self._bank_action_by_id.get(action_id)
+        if action is None:
+            return
+        action.undone = True
+        action.undone_at = int(undone_at)
+        key = (action.guild_id, action.actor_id)
+        if self._bank_last_action_by_actor.get(key) is action:
+            self._bank_refresh_last_action(key)
 
     def bank_list_actions(self, guild_id: int, limit: int = 25) -> List[BankAction]:
         if self.bank_db is not None:
@@ -935,13 +1364,21 @@ class Store:
 
     def ticket_set_config(self, config: TicketConfig) -> None:
         self.ticket_configs[int(config.guild_id)] = config
+        self._ticket_config_cache.pop(int(config.guild_id), None)
 
     def ticket_create_record(self, record: TicketRecord) -> None:
         now = int(time.time())
         record.created_at = int(record.created_at or now)
         record.updated_at = int(record.updated_at or record.created_at)
+        previous = self.ticket_records.get(record.ticket_id)
+        if previous is not None:
+            self._ticket_unindex_channel_ref(previous)
+        else:
+            self._ticket_order[record.ticket_id] = self._ticket_next_order
+            self._ticket_next_order += 1
         self.ticket_records[record.ticket_id] = record
         self._ticket_index_record(record)
+        self._ticket_index_channel_ref(record)
 
     def ticket_update_status(self, ticket_id: str, status: TicketRecordStatus, at: Optional[int] = None) -> Optional[TicketRecord]:
         record = self.ticket_records.get(str(ticket_id))
@@ -961,41 +1398,68 @@ class Store:
         record = self.ticket_records.get(str(ticket_id))
         if not record:
             return None
+        self._ticket_unindex_channel_ref(record)
         record.channel_id = channel_id
         record.thread_id = thread_id
         record.updated_at = int(time.time())
+        self._ticket_index_channel_ref(record)
         return record
 
+    def _ticket_messages_for(self, ticket_key: str) -> Optional[List[TicketMessageSnapshot]]:
+        snapshots = self.ticket_messages.get(ticket_key)
+        if snapshots is None and ticket_key in self._ticket_messages_raw:
+            now = int(time.time())
+            raw_snapshots = self._ticket_messages_raw.pop(ticket_key)
+            snapshots = [_decode_ticket_snapshot(snap, now) for snap in raw_snapshots]
+            self.ticket_messages[ticket_key] = snapshots
+        return snapshots
+
     def ticket_append_snapshot(self, ticket_id: str, snapshot: TicketMessageSnapshot) -> None:
         ticket_key = str(ticket_id)
-        if ticket_key not in self.ticket_messages:
-            self.ticket_messages[ticket_key] = []
-        self.ticket_messages[ticket_key].append(snapshot)
+        snapshots = self._ticket_messages_for(ticket_key)
+        if snapshots is None:
+            snapshots = self.ticket_messages[ticket_key] = []
+        snapshots.append(snapshot)
 
     def ticket_get_transcript(self, ticket_id: str) -> List[TicketMessageSnapshot]:
-        return list(self.ticket_messages.get(str(ticket_id), []))
+        return list(self._ticket_messages_for(str(ticket_id)) or [])
+
+    def ticket_delete_record(self, ticket_id: str) -> Optional[TicketRecord]:
+        ticket_key = str(ticket_id)
+        record = self.ticket_records.pop(ticket_key, None)
+        self.ticket_messages.pop(ticket_key, None)
+        self._ticket_messages_raw.pop(ticket_key, None)
+        self._ticket_order.pop(ticket_key, None)
+        if record is not None:
+            self._ticket_unindex_channel_ref(record)
+            self._ticket_open_by_guild.get(int(record.guild_id), {}).pop(ticket_key, None)
+            for status in (*_TICKET_STATUSES, None):
+                ticket_ids = self._ticket_index.get((int(record.guild_id), int(record.owner_user_id), status))
+                if ticket_ids is not None:
+                    ticket_ids.discard(ticket_key)
+        return record
 
     def ticket_find_by_user(self, guild_id: int, user_id: int, status: Optional[TicketRecordStatus] = None) -> List[TicketRecord]:
-        user_idx = self.ticket_by_user.get(int(guild_id), {}).get(int(user_id), {})
-        if status is not None:
-            ticket_ids = sorted(user_idx.get(status, set()))
-        else:
-            ticket_ids = sorted(set().union(*[user_idx.get("open", set()), user_idx.get("closed", set()), user_idx.get("deleted", set())]))
+        ticket_ids = sorted(self._ticket_index.get((int(guild_id), int(user_id), status), ()))
         return [self.ticket_records[ticket_id] for ticket_id in ticket_ids if ticket_id in self.ticket_records]
 
     def ticket_find_by_channel(self, guild_id: int, channel_id: Optional[int] = None, thread_id: Optional[int] = None) -> Optional[TicketRecord]:
-        for record in self.ticket_records.values():
-            if int(record.guild_id) != int(guild_id):
+        """First ticket in ticket_records order whose channel or thread matches."""
+        gid = int(guild_id)
+        found: Optional[TicketRecord] = None
+        found_order = 0
+        for index, ref in ((self._ticket_by_channel, channel_id), (self._ticket_by_thread, thread_id)):
+            if ref is None:
                 continue
-            if channel_id is not None and record.channel_id == channel_id:
-                return record
-            if thread_id is not None and record.thread_id == thread_id:
-                return record
-        return None
+            for ticket_id in index.get(int(ref), ()):
+                record = self.ticket_records.get(ticket_id)
+                if record is None or int(record.guild_id) != gid:
+                    continue
+                order = self._ticket_order[ticket_id]
+                if found is None or order < found_order:
+                    found, found_order = record, order
+        return found
 
     def ticket_list_open(self, guild_id: int) -> List[TicketRecord]:
-        out: List[TicketRecord] = []
-        for record in self.ticket_records.values():
-            if int(record.guild_id) == int(guild_id) and record.status == "open":
-                out.append(record)
-        return out
+        open_ids = self._ticket_open_by_guild.get(int(guild_id), ())
+        return [self.ticket_records[ticket_id] for ticket_id in open_ids if ticket_id in self.ticket_records]
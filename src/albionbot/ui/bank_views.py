@@ -1,8 +1,13 @@
-from typing import Awaitable, Callable, List, Tuple
+from typing import Awaitable, Callable, Dict, List, Tuple
 
 import nextcord
 
+from ..utils.text import parse_amount
+from .base import OwnerOnlyView
 
+
+# Both callbacks receive an already deferred interaction: answer through
+# interaction.edit_original_message / interaction.followup, not interaction.response.
 PaySubmitCallback = Callable[[nextcord.Interaction, int, str], Awaitable[None]]
 ConfirmCallback = Callable[[nextcord.Interaction], Awaitable[None]]
 
@@ -30,31 +35,30 @@ class PayDetailsModal(nextcord.ui.Modal):
         self.add_item(self.note_input)
 
     async def callback(self, interaction: nextcord.Interaction):
-        raw_amount = str(self.amount_input.value).strip().replace(" ", "")
-        if not raw_amount.isdigit():
+        amount = parse_amount(str(self.amount_input.value))
+        if amount is None:
             return await interaction.response.send_message("Montant invalide: mets un entier positif.", ephemeral=True)
 
-        amount = int(raw_amount)
         if amount <= 0:
             return await interaction.response.send_message("Montant invalide: mets une valeur > 0.", ephemeral=True)
 
+        if not interaction.response.is_done():
+            # Opened from a slash command: defer with a (public) "thinking" reply.
+            await interaction.response.defer(with_message=True)
         await self.on_submit_cb(interaction, amount, str(self.note_input.value).strip())
 
 
-class BankActionConfirmView(nextcord.ui.View):
+class BankActionConfirmView(OwnerOnlyView):
+    not_owner_message = "Cette confirmation n'est pas pour toi."
+
     def __init__(self, owner_id: int, on_confirm: ConfirmCallback):
-        super().__init__(timeout=180)
-        self.owner_id = owner_id
+        super().__init__(owner_id, timeout=180)
         self.on_confirm = on_confirm
 
-    async def interaction_check(self, interaction: nextcord.Interaction) -> bool:
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message("Cette confirmation n'est pas pour toi.", ephemeral=True)
-            return False
-        return True
-
     @nextcord.ui.button(label="Confirmer", style=nextcord.ButtonStyle.success)
     async def confirm(self, button: nextcord.ui.Button, interaction: nextcord.Interaction):
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         await self.on_confirm(interaction)
 
     @nextcord.ui.button(label="Annuler", style=nextcord.ButtonStyle.danger)
@@ -63,7 +67,9 @@ class BankActionConfirmView(nextcord.ui.View):
         await interaction.response.edit_message(content="❎ Action annulée.", view=None)
 
 
-class BankLeaderboardView(nextcord.ui.View):
+class BankLeaderboardView(OwnerOnlyView):
+    not_owner_message = "Ce leaderboard n'est pas pour toi."
+
     def __init__(
         self,
         owner_id: int,
@@ -71,16 +77,15 @@ class BankLeaderboardView(nextcord.ui.View):
         entries: List[Tuple[int, int]],
         page_size: int = 10,
     ):
-        super().__init__(timeout=300)
-        self.owner_id = owner_id
+        super().__init__(owner_id, timeout=300)
         self.guild_name = guild_name
         self.entries = entries
         self.page_size = max(1, page_size)
+        self.page_count = max(1, (len(entries) + self.page_size - 1) // self.page_size)
         self.page = 0
-
-    @property
-    def page_count(self) -> int:
-        return max(1, (len(self.entries) + self.page_size - 1) // self.page_size)
+        # page -> rendered embed; pages are formatted on first visit
+        # (entries can run into the thousands, most pages are never opened).
+        self._embeds: Dict[int, nextcord.Embed] = {}
 
     def _slice(self) -> List[Tuple[int, int]]:
         start = self.page * self.page_size
@@ -91,11 +96,10 @@ class BankLeaderboardView(nextcord.ui.View):
             return "Aucune entrée de banque pour ce serveur."
 
         start_rank = self.page * self.page_size + 1
-        lines: List[str] = []
-        for i, (user_id, balance) in enumerate(self._slice()):
-            rank = start_rank + i
-            lines.append(f"**#{rank}** • <@{user_id}> — **{balance:,}**")
-        return "\n".join(lines)
+        return "\n".join(
+            f"**#{rank}** • <@{user_id}> — **{balance:,}**"
+            for rank, (user_id, balance) in enumerate(self._slice(), start=start_rank)
+        )
 
     def _update_buttons(self) -> None:
         has_multiple_pages = self.page_count > 1
@@ -104,20 +108,17 @@ class BankLeaderboardView(nextcord.ui.View):
 
     def render_embed(self) -> nextcord.Embed:
         self._update_buttons()
-        embed = nextcord.Embed(
-            title=f"🏦 Leaderboard banque — {self.guild_name}",
-            description=self._build_description(),
-            color=nextcord.Color.gold(),
-        )
-        embed.set_footer(text=f"Page {self.page + 1}/{self.page_count} • {len(self.entries)} entrée(s)")
+        embed = self._embeds.get(self.page)
+        if embed is None:
+            embed = nextcord.Embed(
+                title=f"🏦 Leaderboard banque — {self.guild_name}",
+                description=self._build_description(),
+                color=nextcord.Color.gold(),
+            )
+            embed.set_footer(text=f"Page {self.page + 1}/{self.page_count} • {len(self.entries)} entrée(s)")
+            self._embeds[self.page] = embed
         return embed
 
-    async def interaction_check(self, interaction: nextcord.Interaction) -> bool:
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message("Ce leaderboard n'est pas pour toi.", ephemeral=True)
-            return False
-        return True
-
     @nextcord.ui.button(label="⬅️ Précédent", style=nextcord.ButtonStyle.secondary)
     async def prev_button(self, button: nextcord.ui.Button, interaction: nextcord.Interaction):
         self.page = max(0, self.page - 1)
@@ -0,0 +1,17 @@
+import nextcord
+
+
+class OwnerOnlyView(nextcord.ui.View):
+    """View that only answers the user who opened it."""
+
+    not_owner_message: str = "Ce menu n'est pas pour toi."
+
+    def __init__(self, owner_id: int, *, timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.owner_id = owner_id
+
+    async def interaction_check(self, interaction: nextcord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message(self.not_owner_message, ephemeral=True)
+            return False
+        return True
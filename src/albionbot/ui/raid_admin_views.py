@@ -1,21 +1,25 @@
 from dataclasses import dataclass
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 import nextcord
 
+from .base import OwnerOnlyView
 
+
+# Both callbacks receive an already deferred interaction: answer through
+# interaction.edit_original_message / interaction.followup.
 CloseCallback = Callable[[nextcord.Interaction, str], Awaitable[None]]
 EditCallback = Callable[[nextcord.Interaction, str, str, str], Awaitable[None]]
 
 
-@dataclass
+@dataclass(slots=True)
 class RaidAssistantState:
     raid_id: str = ""
 
 
 class RaidSelect(nextcord.ui.Select):
-    def __init__(self, owner_id: int, options: List[nextcord.SelectOption]):
-        self.owner_id = owner_id
+    def __init__(self, options: List[nextcord.SelectOption], assistant: "RaidAssistantView"):
+        self.assistant = assistant
         super().__init__(
             placeholder="Choisis un raid actif",
             min_values=1,
@@ -24,13 +28,11 @@ class RaidSelect(nextcord.ui.Select):
         )
 
     async def callback(self, interaction: nextcord.Interaction):
-        if interaction.user.id != self.owner_id:
-            return await interaction.response.send_message("Ce menu n'est pas pour toi.", ephemeral=True)
-        view = self.view
-        if not isinstance(view, RaidAssistantView):
-            return
+        # Owner already checked by RaidAssistantView.interaction_check.
+        view = self.assistant
         view.state.raid_id = self.values[0]
-        await interaction.response.edit_message(content=view.render_content(), view=view)
+        # Only the text changes; the components already on the message stay as they are.
+        await interaction.response.edit_message(content=view.render_content())
 
 
 class RaidEditModal(nextcord.ui.Modal):
@@ -55,6 +57,8 @@ class RaidEditModal(nextcord.ui.Modal):
         raid_id = self.assistant_view.state.raid_id
         if not raid_id:
             return await interaction.response.send_message("Choisis d'abord un raid.", ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         await self.assistant_view.on_edit(
             interaction,
             raid_id,
@@ -63,35 +67,38 @@ class RaidEditModal(nextcord.ui.Modal):
         )
 
 
-class RaidAssistantView(nextcord.ui.View):
+class RaidAssistantView(OwnerOnlyView):
+    not_owner_message = "Cet assistant n'est pas pour toi."
+
     def __init__(self, owner_id: int, options: List[nextcord.SelectOption], on_close: CloseCallback, on_edit: EditCallback):
-        super().__init__(timeout=600)
-        self.owner_id = owner_id
+        super().__init__(owner_id, timeout=600)
         self.on_close = on_close
         self.on_edit = on_edit
         self.state = RaidAssistantState(raid_id=options[0].value if options else "")
+        # (raid_id, content) of the last render_content() call.
+        self._content_cache: Optional[Tuple[str, str]] = None
         if options:
-            self.add_item(RaidSelect(owner_id=owner_id, options=options))
+            self.add_item(RaidSelect(options=options, assistant=self))
 
     def render_content(self) -> str:
-        selected = self.state.raid_id or "aucun"
-        return (
+        raid_id = self.state.raid_id
+        if self._content_cache is not None and self._content_cache[0] == raid_id:
+            return self._content_cache[1]
+        content = (
             "🛡️ **Assistant raid**\n"
             "1) Sélectionne un raid actif.\n"
             "2) Ferme-le ou modifie titre/date via modal.\n\n"
-            f"• Raid sélectionné: `{selected}`"
+            f"• Raid sélectionné: `{raid_id or 'aucun'}`"
         )
-
-    async def interaction_check(self, interaction: nextcord.Interaction) -> bool:
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message("Cet assistant n'est pas pour toi.", ephemeral=True)
-            return False
-        return True
+        self._content_cache = (raid_id, content)
+        return content
 
     @nextcord.ui.button(label="Fermer raid", style=nextcord.ButtonStyle.danger)
     async def close_raid(self, button: nextcord.ui.Button, interaction: nextcord.Interaction):
         if not self.state.raid_id:
             return await interaction.response.send_message("Choisis d'abord un raid.", ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         await self.on_close(interaction, self.state.raid_id)
 
     @nextcord.ui.button(label="Modifier titre/date", style=nextcord.ButtonStyle.primary)
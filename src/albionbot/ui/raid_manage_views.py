@@ -2,9 +2,13 @@ from typing import Awaitable, Callable
 
 import nextcord
 
+from .base import OwnerOnlyView
+
 
 RaidOpenSubmitCallback = Callable[[nextcord.Interaction, str, str, str, str, str], Awaitable[None]]
 LootParamsSubmitCallback = Callable[[nextcord.Interaction, str, str, str], Awaitable[None]]
+# Receives an already deferred interaction: answer through
+# interaction.edit_original_message / interaction.followup.
 ConfirmCallback = Callable[[nextcord.Interaction], Awaitable[None]]
 
 
@@ -58,20 +62,17 @@ class LootSplitParamsModal(nextcord.ui.Modal):
         )
 
 
-class ConfirmView(nextcord.ui.View):
+class ConfirmView(OwnerOnlyView):
+    not_owner_message = "Cette action n'est pas pour toi."
+
     def __init__(self, owner_id: int, on_confirm: ConfirmCallback):
-        super().__init__(timeout=180)
-        self.owner_id = owner_id
+        super().__init__(owner_id, timeout=180)
         self.on_confirm = on_confirm
 
-    async def interaction_check(self, interaction: nextcord.Interaction) -> bool:
-        if interaction.user.id != self.owner_id:
-            await interaction.response.send_message("Cette action n'est pas pour toi.", ephemeral=True)
-            return False
-        return True
-
     @nextcord.ui.button(label="Confirmer", style=nextcord.ButtonStyle.success)
     async def confirm(self, button: nextcord.ui.Button, interaction: nextcord.Interaction):
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         await self.on_confirm(interaction)
 
     @nextcord.ui.button(label="Annuler", style=nextcord.ButtonStyle.danger)
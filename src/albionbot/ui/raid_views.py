@@ -1,14 +1,12 @@
 import nextcord
-from nextcord.ext import commands
 from typing import List
 
 from ..storage.store import RaidEvent, CompTemplate
 from ..utils.text import limit_str
 
 class IpModal(nextcord.ui.Modal):
-    def __init__(self, *, bot: commands.Bot, raid_id: str, role_key: str, role_label: str, on_submit):
+    def __init__(self, *, raid_id: str, role_key: str, role_label: str, on_submit):
         super().__init__(title=f"IP requis — {role_label}", timeout=180)
-        self.bot = bot
         self.raid_id = raid_id
         self.role_key = role_key
         self.on_submit_cb = on_submit
@@ -26,8 +24,7 @@ class IpModal(nextcord.ui.Modal):
         await self.on_submit_cb(interaction, self.raid_id, self.role_key, str(self.ip_input.value).strip())
 
 class RoleSelect(nextcord.ui.Select):
-    def __init__(self, *, bot: commands.Bot, raid_id: str, options: List[nextcord.SelectOption], page: int, pages: int, disabled: bool, on_select):
-        self.bot = bot
+    def __init__(self, *, raid_id: str, options: List[nextcord.SelectOption], page: int, pages: int, disabled: bool, on_select):
         self.raid_id = raid_id
         self.on_select_cb = on_select
         super().__init__(
@@ -43,9 +40,8 @@ class RoleSelect(nextcord.ui.Select):
         await self.on_select_cb(interaction, self.raid_id, self.values[0])
 
 class AbsentButton(nextcord.ui.Button):
-    def __init__(self, *, bot: commands.Bot, raid_id: str, disabled: bool, on_click):
+    def __init__(self, *, raid_id: str, disabled: bool, on_click):
         super().__init__(label="Absent (toggle)", style=nextcord.ButtonStyle.secondary, custom_id=f"raid:{raid_id}:absent", disabled=disabled)
-        self.bot = bot
         self.raid_id = raid_id
         self.on_click_cb = on_click
 
@@ -53,9 +49,8 @@ class AbsentButton(nextcord.ui.Button):
         await self.on_click_cb(interaction, self.raid_id)
 
 class LeaveButton(nextcord.ui.Button):
-    def __init__(self, *, bot: commands.Bot, raid_id: str, disabled: bool, on_click):
+    def __init__(self, *, raid_id: str, disabled: bool, on_click):
         super().__init__(label="Leave", style=nextcord.ButtonStyle.secondary, custom_id=f"raid:{raid_id}:leave", disabled=disabled)
-        self.bot = bot
         self.raid_id = raid_id
         self.on_click_cb = on_click
 
@@ -63,9 +58,8 @@ class LeaveButton(nextcord.ui.Button):
         await self.on_click_cb(interaction, self.raid_id)
 
 class NotifyButton(nextcord.ui.Button):
-    def __init__(self, *, bot: commands.Bot, raid_id: str, disabled: bool, on_click):
+    def __init__(self, *, raid_id: str, disabled: bool, on_click):
         super().__init__(label="DM notif (toggle)", style=nextcord.ButtonStyle.primary, custom_id=f"raid:{raid_id}:notify", disabled=disabled)
-        self.bot = bot
         self.raid_id = raid_id
         self.on_click_cb = on_click
 
@@ -73,35 +67,33 @@ class NotifyButton(nextcord.ui.Button):
         await self.on_click_cb(interaction, self.raid_id)
 
 class RaidView(nextcord.ui.View):
-    def __init__(self, *, bot: commands.Bot, raid: RaidEvent, template: CompTemplate, join_disabled: bool, actions_disabled: bool, notify_disabled: bool, on_select, on_absent, on_leave, on_notify):
+    def __init__(self, *, raid: RaidEvent, template: CompTemplate, join_disabled: bool, actions_disabled: bool, notify_disabled: bool, on_select, on_absent, on_leave, on_notify):
         super().__init__(timeout=None)
 
-        options_all: List[nextcord.SelectOption] = []
-        for r in template.roles:
-            desc = f"slots {r.slots}"
-            if r.ip_required:
-                desc += " • IP"
-            if r.required_role_ids:
-                desc += " • req"
-            options_all.append(nextcord.SelectOption(
-                label=limit_str(r.label, 90),
-                value=r.key,
-                description=limit_str(desc, 100),
-            ))
-
-        chunks = [options_all[i:i+25] for i in range(0, len(options_all), 25)]
-        pages = max(1, len(chunks))
-        for idx, chunk in enumerate(chunks, start=1):
+        roles = template.roles
+        pages = max(1, -(-len(roles) // 25))
+        for idx, start in enumerate(range(0, len(roles), 25), start=1):
+            options: List[nextcord.SelectOption] = []
+            for r in roles[start:start + 25]:
+                desc = [f"slots {r.slots}"]
+                if r.ip_required:
+                    desc.append("IP")
+                if r.required_role_ids:
+                    desc.append("req")
+                options.append(nextcord.SelectOption(
+                    label=limit_str(r.label, 90),
+                    value=r.key,
+                    description=" • ".join(desc),
+                ))
             self.add_item(RoleSelect(
-                bot=bot,
                 raid_id=raid.raid_id,
-                options=chunk,
+                options=options,
                 page=idx,
                 pages=pages,
                 disabled=join_disabled,
                 on_select=on_select,
             ))
 
-        self.add_item(AbsentButton(bot=bot, raid_id=raid.raid_id, disabled=actions_disabled, on_click=on_absent))
-        self.add_item(LeaveButton(bot=bot, raid_id=raid.raid_id, disabled=actions_disabled, on_click=on_leave))
-        self.add_item(NotifyButton(bot=bot, raid_id=raid.raid_id, disabled=notify_disabled, on_click=on_notify))
+        self.add_item(AbsentButton(raid_id=raid.raid_id, disabled=actions_disabled, on_click=on_absent))
+        self.add_item(LeaveButton(raid_id=raid.raid_id, disabled=actions_disabled, on_click=on_leave))
+        self.add_item(NotifyButton(raid_id=raid.raid_id, disabled=notify_disabled, on_click=on_notify))
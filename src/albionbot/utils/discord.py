@@ -1,23 +1,17 @@
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 import nextcord
 
+_ID_RE = re.compile(r"\d{5,}")
+
 def parse_ids(text: str) -> List[int]:
-    ids = re.findall(r"\d{5,}", text or "")
-    out = []
-    for s in ids:
-        try:
-            out.append(int(s))
-        except ValueError:
-            pass
-    # unique stable
-    seen = set()
-    uniq = []
-    for x in out:
-        if x not in seen:
-            uniq.append(x)
-            seen.add(x)
-    return uniq
+    if not text:
+        return []
+    # dict as an ordered set: unique, in order of appearance
+    seen: Dict[int, None] = {}
+    for m in _ID_RE.finditer(text):
+        seen[int(m.group())] = None
+    return list(seen)
 
 def mention(user_id: int) -> str:
     return f"<@{user_id}>"
@@ -28,5 +22,7 @@ def channel_mention(ch_id: Optional[int]) -> str:
 def has_any_role(member: nextcord.Member, role_ids: List[int]) -> bool:
     if not role_ids:
         return True
-    ids = {r.id for r in member.roles}
-    return any(rid in ids for rid in role_ids)
+    # get_role() bisects the member's role ids; member.roles would build and
+    # sort a Role list on every call. @everyone (the guild id) is implicit.
+    everyone_id = member.guild.id
+    return any(rid == everyone_id or member.get_role(rid) is not None for rid in role_ids)
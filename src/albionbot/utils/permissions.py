@@ -1,4 +1,4 @@
-from typing import Iterable, List, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import nextcord
 
@@ -16,6 +16,15 @@ MANAGER_PERMISSIONS = {
     PERM_TICKET_MANAGER,
 }
 
+# Role ids from the env config, used when a guild has none stored for the key.
+_CFG_FALLBACK_ROLES: Dict[str, Callable[[Config], Tuple[Optional[int], ...]]] = {
+    PERM_RAID_MANAGER: lambda cfg: (cfg.raid_manager_role_id,),
+    PERM_BANK_MANAGER: lambda cfg: (cfg.bank_manager_role_id,),
+    # Backward compatibility: older deployments may still define ticket role IDs
+    # through SUPPORT_ROLE_ID / TICKET_ADMIN_ROLE_ID env vars.
+    PERM_TICKET_MANAGER: lambda cfg: (cfg.support_role_id, cfg.ticket_admin_role_id),
+}
+
 
 def role_ids_for_permission(cfg: Config, store: Optional[Store], guild_id: int, permission_key: str) -> List[int]:
     role_ids: List[int] = []
@@ -24,21 +33,18 @@ def role_ids_for_permission(cfg: Config, store: Optional[Store], guild_id: int,
     if role_ids:
         return role_ids
 
-    if permission_key == PERM_RAID_MANAGER and cfg.raid_manager_role_id is not None:
-        return [cfg.raid_manager_role_id]
-    if permission_key == PERM_BANK_MANAGER and cfg.bank_manager_role_id is not None:
-        return [cfg.bank_manager_role_id]
-    # Backward compatibility: older deployments may still define ticket role IDs
-    # through SUPPORT_ROLE_ID / TICKET_ADMIN_ROLE_ID env vars.
-    if permission_key == PERM_TICKET_MANAGER:
-        role_ids: List[int] = []
-        if cfg.support_role_id is not None:
-            role_ids.append(cfg.support_role_id)
-        if cfg.ticket_admin_role_id is not None:
-            role_ids.append(cfg.ticket_admin_role_id)
-        if role_ids:
-            return role_ids
-    return []
+    getter = _CFG_FALLBACK_ROLES.get(permission_key)
+    if getter is None:
+        return []
+    return [rid for rid in getter(cfg) if rid is not None]
+
+
+def _allowed_role_set(cfg: Config, store: Optional[Store], guild_id: int, permission_key: str) -> FrozenSet[int]:
+    if store is not None:
+        role_set = store.get_permission_role_set(guild_id, permission_key)
+        if role_set:
+            return role_set
+    return frozenset(role_ids_for_permission(cfg, None, guild_id, permission_key))
 
 
 def has_logical_permission(
@@ -60,11 +66,11 @@ def has_logical_permission(
         return True
     if permission_key == PERM_BANK_MANAGER and cfg.bank_require_manage_guild and can_manage_guild:
         return True
-    allowed_role_ids = role_ids_for_permission(cfg, store, guild_id, permission_key)
-    allowed_user_ids = store.get_permission_user_ids(guild_id, permission_key) if store is not None else []
-    if user_id is not None and int(user_id) in set(allowed_user_ids):
+    if user_id is not None and store is not None and int(user_id) in store.get_permission_user_set(guild_id, permission_key):
         return True
+    allowed_role_ids = _allowed_role_set(cfg, store, guild_id, permission_key)
     if not allowed_role_ids:
+        # role_ids has not been consumed yet, so the raid fallback can iterate it.
         return permission_key == PERM_TICKET_MANAGER and has_logical_permission(
             cfg,
             store,
@@ -75,17 +81,26 @@ def has_logical_permission(
             is_admin=is_admin,
             can_manage_guild=can_manage_guild,
         )
-    return bool(set(map(int, role_ids)).intersection(allowed_role_ids))
+    # Stops at the first matching member role; no set of the member's roles is built.
+    return not allowed_role_ids.isdisjoint(map(int, role_ids))
+
+
+def _is_guild_owner(member: nextcord.Member) -> bool:
+    # The owner holds every permission; one int compare instead of folding roles.
+    return member.id == member.guild.owner_id
 
 
 def is_guild_admin(member: nextcord.Member) -> bool:
-    return bool(member.guild_permissions.administrator)
+    return _is_guild_owner(member) or bool(member.guild_permissions.administrator)
 
 
 def can_manage_raids(cfg: Config, member: nextcord.Member, store: Optional[Store] = None) -> bool:
-    if member.guild_permissions.administrator:
+    if _is_guild_owner(member):
         return True
-    if cfg.raid_require_manage_guild and member.guild_permissions.manage_guild:
+    perms = member.guild_permissions  # computed from the member's roles on each access
+    if perms.administrator:
+        return True
+    if cfg.raid_require_manage_guild and perms.manage_guild:
         return True
     return has_logical_permission(
         cfg,
@@ -94,15 +109,18 @@ def can_manage_raids(cfg: Config, member: nextcord.Member, store: Optional[Store
         PERM_RAID_MANAGER,
         (r.id for r in member.roles),
         user_id=member.id,
-        is_admin=bool(member.guild_permissions.administrator),
-        can_manage_guild=bool(member.guild_permissions.manage_guild),
+        is_admin=False,
+        can_manage_guild=bool(perms.manage_guild),
     )
 
 
 def can_manage_bank(cfg: Config, member: nextcord.Member, store: Optional[Store] = None) -> bool:
-    if member.guild_permissions.administrator:
+    if _is_guild_owner(member):
+        return True
+    perms = member.guild_permissions
+    if perms.administrator:
         return True
-    if cfg.bank_require_manage_guild and member.guild_permissions.manage_guild:
+    if cfg.bank_require_manage_guild and perms.manage_guild:
         return True
     return has_logical_permission(
         cfg,
@@ -111,13 +129,16 @@ def can_manage_bank(cfg: Config, member: nextcord.Member, store: Optional[Store]
         PERM_BANK_MANAGER,
         (r.id for r in member.roles),
         user_id=member.id,
-        is_admin=bool(member.guild_permissions.administrator),
-        can_manage_guild=bool(member.guild_permissions.manage_guild),
+        is_admin=False,
+        can_manage_guild=bool(perms.manage_guild),
     )
 
 
 def can_manage_tickets(cfg: Config, member: nextcord.Member, store: Optional[Store] = None) -> bool:
-    if member.guild_permissions.administrator:
+    if _is_guild_owner(member):
+        return True
+    perms = member.guild_permissions
+    if perms.administrator:
         return True
     return has_logical_permission(
         cfg,
@@ -126,6 +147,34 @@ def can_manage_tickets(cfg: Config, member: nextcord.Member, store: Optional[Sto
         PERM_TICKET_MANAGER,
         (r.id for r in member.roles),
         user_id=member.id,
-        is_admin=bool(member.guild_permissions.administrator),
-        can_manage_guild=bool(member.guild_permissions.manage_guild),
+        is_admin=False,
+        can_manage_guild=bool(perms.manage_guild),
     )
+
+
+def manager_permissions(cfg: Config, member: nextcord.Member, store: Optional[Store] = None) -> Set[str]:
+    """Manager permissions held by ``member``, same result as the can_manage_* checks.
+
+    Reads the member's guild permissions and roles once for all keys.
+    """
+    if _is_guild_owner(member):
+        return set(MANAGER_PERMISSIONS)
+    perms = member.guild_permissions
+    if perms.administrator:
+        return set(MANAGER_PERMISSIONS)
+    role_ids = [r.id for r in member.roles]
+    can_manage_guild = bool(perms.manage_guild)
+    return {
+        permission_key
+        for permission_key in MANAGER_PERMISSIONS
+        if has_logical_permission(
+            cfg,
+            store,
+            member.guild.id,
+            permission_key,
+            role_ids,
+            user_id=member.id,
+            is_admin=False,
+            can_manage_guild=can_manage_guild,
+        )
+    }
@@ -1,21 +1,39 @@
-from typing import List
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional
+
+# Spaces users type as thousands separators ("250 000", NBSP from copy/paste).
+_SPACE_TBL = str.maketrans("", "", " \u00a0\t")
 
 def limit_str(s: str, n: int) -> str:
     if len(s) <= n:
         return s
-    return s[: max(0, n - 1)] + "…"
+    if n <= 1:
+        return "…"
+    return s[: n - 1] + "…"
+
+def parse_amount(raw: str) -> Optional[int]:
+    s = raw.strip()
+    if " " in s or "\u00a0" in s or "\t" in s:
+        s = s.translate(_SPACE_TBL)
+    return int(s) if s.isascii() and s.isdigit() else None
 
 def chunk_text_lines(lines: List[str], max_len: int = 1000) -> List[str]:
+    # cum[k]: size of lines[:k], counting one newline per line.
+    cum = list(accumulate((len(ln) + 1 for ln in lines), initial=0))
     chunks = []
-    cur = ""
-    for ln in lines:
-        add = ln + "\n"
-        if len(cur) + len(add) > max_len:
-            if cur.strip():
-                chunks.append(cur.strip())
-            cur = add
+    i, n = 0, len(lines)
+    while i < n:
+        # Greedy: take every following line that still fits; a line longer
+        # than max_len makes a chunk of its own.
+        j = max(i + 1, bisect_right(cum, cum[i] + max_len, i + 1) - 1)
+        first, last = lines[i], lines[j - 1]
+        if first and last and not first[0].isspace() and not last[-1].isspace():
+            # Nothing for strip() to remove: the usual case for embed lines.
+            chunks.append("\n".join(lines[i:j]))
         else:
-            cur += add
-    if cur.strip():
-        chunks.append(cur.strip())
+            chunk = "\n".join(lines[i:j]).strip()
+            if chunk:
+                chunks.append(chunk)
+        i = j
     return chunks
@@ -1,9 +1,31 @@
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 TZ_PARIS = ZoneInfo("Europe/Paris")
+_DT_FORMAT = "%Y-%m-%d %H:%M"
+_EPOCH = datetime(1970, 1, 1)
+
+def _parse_local(s: str) -> datetime:
+    # Fast path for the canonical zero-padded "YYYY-MM-DD HH:MM"; strptime
+    # handles everything else it accepts (e.g. "2026-2-4 9:05").
+    if len(s) == 16 and s[4] == "-" and s[7] == "-" and s[10] == " " and s[13] == ":":
+        parts = (s[0:4], s[5:7], s[8:10], s[11:13], s[14:16])
+        if all(p.isascii() and p.isdigit() for p in parts):
+            y, mo, d, h, mi = map(int, parts)
+            return datetime(y, mo, d, h, mi)
+    return datetime.strptime(s, _DT_FORMAT)
+
+@lru_cache(maxsize=64)
+def _paris_offset(year: int, month: int, day: int, hour: int) -> int:
+    # Paris only switches offset on the hour, so one lookup covers the hour
+    # (fold=0, like datetime.timestamp(), for skipped and repeated times).
+    return int(datetime(year, month, day, hour, tzinfo=TZ_PARIS).utcoffset().total_seconds())
+
+@lru_cache(maxsize=256)
+def _parse_paris_ts(s: str) -> int:
+    local = _parse_local(s)
+    return int((local - _EPOCH).total_seconds()) - _paris_offset(local.year, local.month, local.day, local.hour)
 
 def parse_dt_paris(dt_str: str) -> int:
-    dt = datetime.strptime(dt_str.strip(), "%Y-%m-%d %H:%M")
-    dt = dt.replace(tzinfo=TZ_PARIS)
-    return int(dt.timestamp())
+    return _parse_paris_ts(dt_str.strip())
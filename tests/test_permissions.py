@@ -1,8 +1,18 @@
 import unittest
+from types import SimpleNamespace
 
 from albionbot.config import Config
 from albionbot.storage.store import Store
-from albionbot.utils.permissions import PERM_RAID_MANAGER, has_logical_permission
+from albionbot.utils.permissions import (
+    PERM_BANK_MANAGER,
+    PERM_RAID_MANAGER,
+    PERM_TICKET_MANAGER,
+    can_manage_bank,
+    can_manage_raids,
+    can_manage_tickets,
+    has_logical_permission,
+    manager_permissions,
+)
 
 
 class PermissionLayerTests(unittest.TestCase):
@@ -82,6 +92,50 @@ class PermissionLayerTests(unittest.TestCase):
         )
         self.assertFalse(allowed)
 
+    def test_cached_role_set_follows_updates(self):
+        def check(role_ids):
+            return has_logical_permission(
+                self.cfg,
+                self.store,
+                self.guild_id,
+                PERM_RAID_MANAGER,
+                role_ids=role_ids,
+                is_admin=False,
+                can_manage_guild=False,
+            )
+
+        self.assertTrue(check([self.manager_role]))
+        self.store.set_permission_role_ids(self.guild_id, PERM_RAID_MANAGER, [555])
+        self.assertFalse(check([self.manager_role]))
+        self.assertTrue(check([111, 555]))
+
+    def test_manager_permissions_matches_individual_checks(self):
+        self.store.set_permission_role_ids(self.guild_id, PERM_BANK_MANAGER, [222])
+        checks = {
+            PERM_RAID_MANAGER: can_manage_raids,
+            PERM_BANK_MANAGER: can_manage_bank,
+            PERM_TICKET_MANAGER: can_manage_tickets,
+        }
+        for admin, manage_guild, role_ids in [
+            (True, False, []),
+            (False, True, []),
+            (False, False, [self.manager_role]),
+            (False, False, [222]),
+            (False, False, [111]),
+        ]:
+            member = SimpleNamespace(
+                id=1,
+                guild=SimpleNamespace(id=self.guild_id, owner_id=2),
+                guild_permissions=SimpleNamespace(administrator=admin, manage_guild=manage_guild),
+                roles=[SimpleNamespace(id=rid) for rid in role_ids],
+            )
+            expected = {key for key, check in checks.items() if check(self.cfg, member, self.store)}
+            self.assertEqual(manager_permissions(self.cfg, member, self.store), expected)
+
+        member.guild.owner_id = member.id
+        self.assertEqual(manager_permissions(self.cfg, member, self.store), set(checks))
+        self.assertTrue(all(check(self.cfg, member, self.store) for check in checks.values()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from albionbot.storage.store import STATE_DB_KEY, BankAction, RaidEvent, Signup, Store, TicketMessageSnapshot, TicketRecord
+
+
+def _make_store(tmp_path) -> Store:
+    return Store(path=str(tmp_path / "state.json"), bank_database_url="", bank_sqlite_path=str(tmp_path / "bank.sqlite3"))
+
+
+def _make_raid(raid_id: str) -> RaidEvent:
+    return RaidEvent(
+        raid_id=raid_id,
+        template_name="zvz",
+        title="ZvZ",
+        description="",
+        extra_message="",
+        start_at=1_700_000_000,
+        created_by=1,
+        created_at=1_700_000_000,
+    )
+
+
+def test_raid_signups_persist_across_cached_saves(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.raids["R1"] = _make_raid("R1")
+    store.raids["R2"] = _make_raid("R2")
+    store.save()
+
+    store.raids["R1"].signups[42] = Signup(user_id=42, role_key="tank", joined_at=1)
+    store.raids["R1"].absent.add(7)
+    store.raids.pop("R2")
+    store.save()
+
+    reloaded = _make_store(tmp_path)
+    assert set(reloaded.raids) == {"R1"}
+    assert reloaded.raids["R1"].signups[42].role_key == "tank"
+    assert reloaded.raids["R1"].absent == {7}
+    assert reloaded.bank_db.get_state_blob(STATE_DB_KEY)
+
+
+def test_encoded_state_matches_full_serialization(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.raids["R1"] = _make_raid("R1")
+    store.raids["R1"].signups[42] = Signup(user_id=42, role_key="tank", joined_at=1)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42))
+    store.ticket_append_snapshot("T1", TicketMessageSnapshot(message_id=1, author_id=42, content="a", created_at=1))
+    store.save()
+    store.ticket_append_snapshot("T1", TicketMessageSnapshot(message_id=2, author_id=42, content="b", created_at=2))
+    store.ticket_append_snapshot("T2", TicketMessageSnapshot(message_id=3, author_id=7, content="c", created_at=3))
+
+    encoded = json.loads(store._encode_runtime_state())
+    expected = json.loads(json.dumps(store._serialize_runtime_state()))
+    assert encoded == expected
+    assert [m["content"] for m in encoded["tickets"]["messages"]["T1"]] == ["a", "b"]
+
+
+def test_save_skips_rewrite_when_state_is_unchanged(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.raids["R1"] = _make_raid("R1")
+    store.save()
+    mtime = os.stat(store.path).st_mtime_ns
+
+    os.utime(store.path, ns=(mtime - 10_000_000, mtime - 10_000_000))
+    store._last_state_fingerprint = store._compute_state_fingerprint()
+    store.save()
+    assert os.stat(store.path).st_mtime_ns == mtime - 10_000_000
+
+    store.raids["R1"].title = "Renamed"
+    store.save()
+    assert os.stat(store.path).st_mtime_ns != mtime - 10_000_000
+    assert _make_store(tmp_path).raids["R1"].title == "Renamed"
+
+
+def test_async_save_keeps_the_sql_blob_off_the_loop(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.raids["R1"] = _make_raid("R1")
+    store.save()
+
+    def no_read(key):
+        raise AssertionError("state blob read back on save")
+
+    writer_threads = []
+    set_state_blob = store.bank_db.set_state_blob
+
+    def record_write(key, value_json):
+        writer_threads.append(threading.get_ident())
+        set_state_blob(key, value_json)
+
+    store.bank_db.get_state_blob = no_read
+    store.bank_db.set_state_blob = record_write
+
+    async def scenario() -> None:
+        await store.save_async()
+        assert writer_threads == []
+        store.raids["R1"].title = "Renamed"
+        await store.save_async()
+
+    asyncio.run(scenario())
+    assert len(writer_threads) == 1 and writer_threads[0] != threading.get_ident()
+    del store.bank_db.get_state_blob
+    assert _make_store(tmp_path).raids["R1"].title == "Renamed"
+
+
+def test_ticket_user_index_follows_status_changes(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42))
+    store.ticket_create_record(TicketRecord(ticket_id="T2", guild_id=1, owner_user_id=42))
+    store.ticket_update_status("T1", "closed")
+    store.save()
+
+    reloaded = _make_store(tmp_path)
+    assert [r.ticket_id for r in reloaded.ticket_find_by_user(1, 42, "open")] == ["T2"]
+    assert [r.ticket_id for r in reloaded.ticket_find_by_user(1, 42, "closed")] == ["T1"]
+    assert [r.ticket_id for r in reloaded.ticket_find_by_user(1, 42)] == ["T1", "T2"]
+    assert reloaded.ticket_find_by_user(2, 42) == []
+    assert [r.ticket_id for r in reloaded.ticket_list_open(1)] == ["T2"]
+
+    reloaded.ticket_update_status("T1", "open")
+    reloaded.ticket_update_status("T2", "deleted")
+    assert [r.ticket_id for r in reloaded.ticket_list_open(1)] == ["T1"]
+
+
+def test_requested_saves_are_coalesced_and_flushed(tmp_path) -> None:
+    store = _make_store(tmp_path)
+
+    async def scenario() -> None:
+        for i in range(5):
+            store.raids[f"R{i}"] = _make_raid(f"R{i}")
+            store.request_save()
+        assert store.reload_if_changed() is False
+        await store.flush()
+
+    asyncio.run(scenario())
+    assert set(_make_store(tmp_path).raids) == {f"R{i}" for i in range(5)}
+
+
+def test_transcripts_are_decoded_on_first_access(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42))
+    store.ticket_append_snapshot("T1", TicketMessageSnapshot(message_id=1, author_id=42, content="a", created_at=1))
+    store.ticket_append_snapshot("T2", TicketMessageSnapshot(message_id=2, author_id=7, content="b", created_at=2))
+    store.save()
+
+    reloaded = _make_store(tmp_path)
+    assert reloaded.ticket_messages == {}
+    reloaded.ticket_append_snapshot("T1", TicketMessageSnapshot(message_id=3, author_id=42, content="c", created_at=3))
+    reloaded.save()
+
+    again = _make_store(tmp_path)
+    assert [snap.content for snap in again.ticket_get_transcript("T1")] == ["a", "c"]
+    assert [snap.content for snap in again.ticket_get_transcript("T2")] == ["b"]
+
+    again.ticket_delete_record("T1")
+    assert again.ticket_get_transcript("T1") == []
+    assert again.ticket_find_by_user(1, 42) == []
+
+
+def test_ticket_channel_lookup_follows_channel_refs(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42, channel_id=100, thread_id=200))
+    store.ticket_create_record(TicketRecord(ticket_id="T2", guild_id=1, owner_user_id=7, channel_id=100, thread_id=201))
+    store.save()
+
+    reloaded = _make_store(tmp_path)
+    assert reloaded.ticket_find_by_channel(1, thread_id=201).ticket_id == "T2"
+    assert reloaded.ticket_find_by_channel(1, channel_id=100).ticket_id == "T1"
+    assert reloaded.ticket_find_by_channel(2, channel_id=100) is None
+
+    reloaded.ticket_set_channel_ref("T2", channel_id=300)
+    assert reloaded.ticket_find_by_channel(1, thread_id=201) is None
+    assert reloaded.ticket_find_by_channel(1, channel_id=300).ticket_id == "T2"
+    reloaded.ticket_delete_record("T1")
+    assert reloaded.ticket_find_by_channel(1, channel_id=100) is None
+
+
+def test_ticket_channel_lookup_keeps_record_order(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42, channel_id=100, thread_id=500))
+    store.ticket_create_record(TicketRecord(ticket_id="T2", guild_id=1, owner_user_id=7, channel_id=100, thread_id=201))
+    store.ticket_create_record(TicketRecord(ticket_id="T3", guild_id=1, owner_user_id=8, channel_id=500))
+    # Matches T1 by thread and T3 by channel: the earlier record wins.
+    assert store.ticket_find_by_channel(1, channel_id=500, thread_id=500).ticket_id == "T1"
+
+    # Re-homing a ticket does not move it ahead of older ones.
+    store.ticket_set_channel_ref("T1", channel_id=100, thread_id=200)
+    assert store.ticket_find_by_channel(1, channel_id=100).ticket_id == "T1"
+    store.save()
+    assert _make_store(tmp_path).ticket_find_by_channel(1, channel_id=100).ticket_id == "T1"
+
+
+def test_ticket_lookups_accept_string_ids(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.ticket_create_record(TicketRecord(ticket_id="T1", guild_id=1, owner_user_id=42, channel_id=100))
+    store.ticket_set_channel_ref("T1", channel_id="300", thread_id="301")
+    assert store.ticket_find_by_channel("1", channel_id="300").ticket_id == "T1"
+    assert store.ticket_find_by_channel(1, thread_id=301).ticket_id == "T1"
+    assert [r.ticket_id for r in store.ticket_find_by_user("1", "42")] == ["T1"]
+    assert [r.ticket_id for r in store.ticket_list_open("1")] == ["T1"]
+    assert store.guild_lock("1") is store.guild_lock(1)
+
+
+def test_legacy_bank_action_log_is_bounded(tmp_path) -> None:
+    store = Store(path=str(tmp_path / "state.json"), bank_action_log_limit=3, bank_sqlite_path=str(tmp_path / "bank.sqlite3"))
+    store.bank_db = None
+    for i in range(5):
+        store.bank_append_action(BankAction(action_id=f"A{i}", guild_id=1, actor_id=9, created_at=i, action_type="add", deltas={42: 10}))
+    assert [a.action_id for a in store.bank_actions[1]] == ["A2", "A3", "A4"]
+    store.save()
+
+    reloaded = Store(path=str(tmp_path / "other.json"), bank_action_log_limit=3, bank_sqlite_path=str(tmp_path / "other.sqlite3"))
+    reloaded.path = store.path
+    reloaded.bank_db = None
+    reloaded.load()
+    reloaded.bank_append_action(BankAction(action_id="A5", guild_id=1, actor_id=9, created_at=5, action_type="add", deltas={42: 10}))
+    assert [a.action_id for a in reloaded.bank_actions[1]] == ["A3", "A4", "A5"]
+    assert reloaded.bank_find_last_action_for_actor(1, 9).action_id == "A5"
+    reloaded.bank_mark_action_undone("A5", 6)
+    assert reloaded.bank_find_last_action_for_actor(1, 9).action_id == "A4"
+    reloaded.bank_append_action(BankAction(action_id="B1", guild_id=1, actor_id=8, created_at=7, action_type="add", deltas={42: 1}))
+    for i in range(3):
+        reloaded.bank_append_action(BankAction(action_id=f"C{i}", guild_id=1, actor_id=9, created_at=8 + i, action_type="add", deltas={42: 1}))
+    assert reloaded.bank_find_last_action_for_actor(1, 8) is None
+
+
+def test_bank_balances_read_and_write_in_batches(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.bank_set_balance(1, 42, 100)
+    store.bank_set_balances(1, {42: 150, 7: 20})
+    assert store.bank_get_balances(1, [42, 7, 9]) == {42: 150, 7: 20, 9: 0}
+    assert store.bank_get_balance(1, 7) == 20
+
+
+def test_bank_balance_batch_is_all_or_nothing(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    with pytest.raises(OverflowError):
+        store.bank_set_balances(1, {42: 150, 7: 2**70})
+    assert store.bank_get_balances(1, [42, 7]) == {42: 0, 7: 0}
+
+
+def test_ticket_config_view_is_read_only(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    store.set_ticket_config(1, log_channel_id=55)
+    conf = store.get_ticket_config(1)
+    assert conf["log_channel_id"] == 55
+    with pytest.raises(TypeError):
+        conf["log_channel_id"] = 66
+    with pytest.raises(TypeError):
+        conf["ticket_types"]["default"]["label"] = "Changed"
+    assert store.get_ticket_config(1)["ticket_types"]["default"]["label"] == "Support"
+
+
+def test_legacy_bank_changes_take_the_store_lock(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    assert store.bank_lock(1) is store.guild_lock(1)
+
+    store.bank_db = None
+    assert store.bank_lock(1) is store.lock
@@ -0,0 +1,42 @@
+import random
+from typing import List
+
+from albionbot.utils.text import chunk_text_lines, limit_str
+
+
+def _reference_chunks(lines: List[str], max_len: int) -> List[str]:
+    chunks = []
+    cur = ""
+    for ln in lines:
+        add = ln + "\n"
+        if len(cur) + len(add) > max_len:
+            if cur.strip():
+                chunks.append(cur.strip())
+            cur = add
+        else:
+            cur += add
+    if cur.strip():
+        chunks.append(cur.strip())
+    return chunks
+
+
+def test_chunk_text_lines_matches_reference() -> None:
+    rng = random.Random(1234)
+    pool = ["", " ", "  indented", "trailing\t", "**Tank** (2/3)", "• <@123456789012345678> — 1750 IP", "x" * 120]
+    for max_len in (1, 5, 40, 100, 1000):
+        for _ in range(50):
+            lines = [rng.choice(pool) for _ in range(rng.randint(0, 60))]
+            assert chunk_text_lines(lines, max_len=max_len) == _reference_chunks(lines, max_len)
+
+
+def test_chunk_text_lines_keeps_oversized_lines_whole() -> None:
+    assert chunk_text_lines(["a" * 12, "b", "c"], max_len=5) == ["a" * 12, "b\nc"]
+    assert chunk_text_lines([]) == []
+
+
+def test_limit_str_truncates_with_ellipsis() -> None:
+    assert limit_str("abc", 3) == "abc"
+    assert limit_str("abcdef", 4) == "abc…"
+    assert limit_str("abcdef", 1) == "…"
+    assert limit_str("abcdef", 0) == "…"
+    assert limit_str("", 0) == ""
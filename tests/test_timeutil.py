@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import pytest
+
+from albionbot.utils.timeutil import TZ_PARIS, parse_dt_paris
+
+
+def _reference(s: str) -> int:
+    return int(datetime.strptime(s.strip(), "%Y-%m-%d %H:%M").replace(tzinfo=TZ_PARIS).timestamp())
+
+
+@pytest.mark.parametrize("value", [
+    "2026-02-24 20:30",
+    " 2026-07-14 09:05 ",
+    "2026-3-29 2:30",
+    "2026-10-25 02:30",
+    "2026-10-25 03:00",
+    "1969-12-31 23:59",
+])
+def test_parse_dt_paris_matches_strptime(value: str) -> None:
+    assert parse_dt_paris(value) == _reference(value)
+
+
+@pytest.mark.parametrize("value", ["", "2026-02-24", "2026-02-24 2a:30", "2026-02-24 +1:30", "2026-13-01 10:00"])
+def test_parse_dt_paris_rejects_invalid_input(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_dt_paris(value)
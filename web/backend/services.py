@@ -321,8 +321,7 @@ class DashboardService:
         ticket = self.store.ticket_records.get(ticket_id)
         if ticket is None or ticket.guild_id != int(guild_id):
             raise ValidationError(code="ticket_not_found", message="Ticket introuvable")
-        self.store.ticket_records.pop(ticket_id, None)
-        self.store.ticket_messages.pop(ticket_id, None)
+        self.store.ticket_delete_record(ticket_id)
         self.store.save()
 
     def update_raid_template(self, template_name: str, payload: RaidTemplateUpdateRequestDTO) -> TemplateMutationResultDTO: